@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Dict, Any
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 ENGAGEMENT_FOLLOWER_BUCKETS = (
     (5_000, 0.0608),
@@ -25,18 +27,19 @@ POSTS_PER_MONTH_DAYS = 30.0
 POSTS_PER_MONTH_NORMALIZER = 12.0
 SCORE_ROUND_DIGITS = 6
 
+# Tablas de lookup derivadas de los buckets: bisect_right (en C) sobre los límites
+# devuelve el índice del primer límite > followers; el último valor es el default.
+_ENGAGEMENT_LIMITS = tuple(limit for limit, _ in ENGAGEMENT_FOLLOWER_BUCKETS)
+_ENGAGEMENT_VALUES = tuple(v for _, v in ENGAGEMENT_FOLLOWER_BUCKETS) + (ENGAGEMENT_BENCHMARK_DEFAULT,)
+_VIEWS_LIMITS = tuple(limit for limit, _ in VIEWS_FOLLOWER_BUCKETS)
+_VIEWS_VALUES = tuple(v for _, v in VIEWS_FOLLOWER_BUCKETS) + (VIEWS_BENCHMARK_DEFAULT,)
+
 # ---------- Benchmarks ----------
 def get_engagement_benchmark(followers: int) -> float:
-    for limit, value in ENGAGEMENT_FOLLOWER_BUCKETS:
-        if followers < limit:
-            return value
-    return ENGAGEMENT_BENCHMARK_DEFAULT
+    return _ENGAGEMENT_VALUES[bisect_right(_ENGAGEMENT_LIMITS, followers)]
 
 def get_views_benchmark(followers: int) -> float:
-    for limit, value in VIEWS_FOLLOWER_BUCKETS:
-        if followers < limit:
-            return value
-    return VIEWS_BENCHMARK_DEFAULT
+    return _VIEWS_VALUES[bisect_right(_VIEWS_LIMITS, followers)]
 
 # ---------- Normalización/compat ----------
 def _normalize_payload(p: Dict[str, Any]) -> Dict[str, Any]:
@@ -62,45 +65,54 @@ def _normalize_payload(p: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 # ---------- Scores ----------
-def calculate_engagement_score(profile: Dict[str, Any]) -> float:
-    followers = int(profile.get("followers") or 0)
-    avg_likes = float(profile.get("avg_likes") or 0)
-    avg_comments = float(profile.get("avg_comments") or 0)
-    if followers <= 0:
-        return 0.0
-    actual_engagement = (avg_likes + avg_comments) / followers
-    expected_engagement = get_engagement_benchmark(followers)
-    score = min(actual_engagement / expected_engagement, ENGAGEMENT_SCORE_MAX)
-    return round(score, SCORE_ROUND_DIGITS)
-
-def calculate_success_score(profile: Dict[str, Any]) -> float:
-    followers = int(profile.get("followers") or 0)
-    posts = int(profile.get("posts") or 0)
-    avg_likes = float(profile.get("avg_likes") or 0)
-    avg_comments = float(profile.get("avg_comments") or 0)
-    avg_views = float(profile.get("avg_views") or 0)
+@lru_cache(maxsize=4096)
+def _scores(
+    followers: int,
+    posts: int,
+    avg_likes: float,
+    avg_comments: float,
+    avg_views: float,
+) -> Tuple[float, float]:
+    """
+    (engagement_score, success_score) en una sola pasada: la tasa de engagement y su
+    benchmark se calculan una vez y se reutilizan en ambos scores.
+    Función pura sobre escalares: se cachea para perfiles re-evaluados (reintentos, rankings).
+    """
     if followers <= 0:
-        return 0.0
+        return 0.0, 0.0
 
     engagement = (avg_likes + avg_comments) / followers
-    views_rate = avg_views / followers
-    post_month = posts / POSTS_PER_MONTH_DAYS
-
     norm_engagement = min(engagement / get_engagement_benchmark(followers), ENGAGEMENT_SCORE_MAX)
-    norm_views = min(views_rate / get_views_benchmark(followers), ENGAGEMENT_SCORE_MAX)
-    norm_post = min(post_month / POSTS_PER_MONTH_NORMALIZER, ENGAGEMENT_SCORE_MAX)
+    norm_views = min((avg_views / followers) / get_views_benchmark(followers), ENGAGEMENT_SCORE_MAX)
+    norm_post = min((posts / POSTS_PER_MONTH_DAYS) / POSTS_PER_MONTH_NORMALIZER, ENGAGEMENT_SCORE_MAX)
 
-    score = (
+    success = (
         SUCCESS_WEIGHT_ENGAGEMENT * norm_engagement
         + SUCCESS_WEIGHT_VIEWS * norm_views
         + SUCCESS_WEIGHT_POSTS * norm_post
     )
-    return round(score, SCORE_ROUND_DIGITS)
+    return round(norm_engagement, SCORE_ROUND_DIGITS), round(success, SCORE_ROUND_DIGITS)
+
+def _score_args(profile: Dict[str, Any]) -> Tuple[int, int, float, float, float]:
+    return (
+        int(profile.get("followers") or 0),
+        int(profile.get("posts") or 0),
+        float(profile.get("avg_likes") or 0),
+        float(profile.get("avg_comments") or 0),
+        float(profile.get("avg_views") or 0),
+    )
+
+def calculate_engagement_score(profile: Dict[str, Any]) -> float:
+    return _scores(*_score_args(profile))[0]
+
+def calculate_success_score(profile: Dict[str, Any]) -> float:
+    return _scores(*_score_args(profile))[1]
 
 def evaluate_profile(profile: Dict[str, Any]) -> Dict[str, float] | None:
     p = _normalize_payload(profile)
-    engagement_score = calculate_engagement_score(p)
-    success_score = calculate_success_score(p)
+    engagement_score, success_score = _scores(
+        p["followers"], p["posts"], p["avg_likes"], p["avg_comments"], p["avg_views"]
+    )
     return {
         "username": p.get("username"),
         "engagement_score": engagement_score,
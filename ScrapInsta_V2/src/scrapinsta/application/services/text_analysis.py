@@ -1,47 +1,105 @@
 from __future__ import annotations
-from typing import Optional, Dict, List
-import json
+from typing import Any, Optional, Dict, Pattern, Sequence, Tuple
 import re
 from functools import lru_cache
 
 from unidecode import unidecode
-from scrapinsta.config.settings import BASE_DIR
+from scrapinsta.config.settings import load_keywords
 
-KEYWORDS_PATH = BASE_DIR / "config" / "keywords.json"
+
+def _trie_pattern(words: Sequence[str]) -> str:
+    """
+    Arma la alternación como un trie de prefijos comunes (p.ej. `medic(?:o|a)`):
+    el motor de `re` descarta cada posición del texto en un solo recorrido en vez
+    de probar las N palabras una por una, sin depender de Aho-Corasick.
+    """
+    trie: Dict[str, Any] = {}
+    for w in words:
+        if not w:
+            continue
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node: Dict[str, Any]) -> str:
+        alts = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return _build(trie)
+
+
+@lru_cache(maxsize=256)
+def _compile_words(words: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Un único regex `\\b(?:<trie de palabras>)\\b` por rubro (None si no hay palabras)."""
+    body = _trie_pattern(words)
+    if not body:
+        return None
+    return re.compile(r"\b(?:" + body + r")\b")
 
 
 @lru_cache(maxsize=1)
-def _load_keywords() -> Dict[str, List[str]]:
-    with KEYWORDS_PATH.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+def _load_keywords() -> Dict[str, Any]:
+    data = load_keywords()
+    doctor_keywords = [unidecode(k.lower()) for k in data.get("doctor_keywords", [])]
+    rubros = {
+        rubro: [unidecode(w.lower()) for w in words]
+        for rubro, words in data.get("rubros", {}).items()
+    }
     return {
-        "doctor_keywords": [unidecode(k.lower()) for k in data.get("doctor_keywords", [])],
-        "rubros": {
-            rubro: [unidecode(w.lower()) for w in words]
-            for rubro, words in data.get("rubros", {}).items()
-        },
+        "doctor_keywords": doctor_keywords,
+        "rubros": rubros,
+        # Precompilados una vez: prefijos para str.startswith y un regex por rubro
+        "doctor_prefixes": tuple(doctor_keywords),
+        "rubro_patterns": {rubro: _compile_words(tuple(words)) for rubro, words in rubros.items()},
     }
 
 
-def detect_rubro(username: str, bio: Optional[str]) -> Optional[str]:
+@lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    """Minúsculas + unidecode; cacheado porque los usernames se repiten entre etapas."""
+    return unidecode(text.strip().lower())
+
+
+def _rubro_patterns(rubros: Dict[str, Sequence[str]]) -> Dict[str, Optional[Pattern[str]]]:
+    return {rubro: _compile_words(tuple(words)) for rubro, words in rubros.items()}
+
+
+def detect_rubro(
+    username: str,
+    bio: Optional[str],
+    *,
+    keywords: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
     """
     Detecta rubro a partir de username y bio (bio puede ser None).
     - Heurística específica para doctores (prefijo en username).
     - Búsqueda de palabras clave por rubro (coincidencia de palabra).
+
+    `keywords` permite inyectar la tabla ya normalizada (mismo formato que
+    `_load_keywords()`); por defecto se usa la de config/keywords.json.
     """
-    kw = _load_keywords()
-    doctor_keys = kw["doctor_keywords"]
-    rubros = kw["rubros"]
+    kw = keywords if keywords is not None else _load_keywords()
+    doctor_prefixes = kw.get("doctor_prefixes")
+    if doctor_prefixes is None:
+        doctor_prefixes = tuple(kw["doctor_keywords"])
+    patterns = kw.get("rubro_patterns")
+    if patterns is None:
+        patterns = _rubro_patterns(kw["rubros"])
 
-    username_norm = unidecode((username or "").strip().lower())
-    bio_norm = unidecode((bio or "").strip().lower())
+    username_norm = _normalize(username or "")
 
-    if any(username_norm.startswith(key) for key in doctor_keys):
+    if doctor_prefixes and username_norm.startswith(doctor_prefixes):
         return "Doctor"
 
-    for rubro, words in rubros.items():
-        for w in words:
-            if re.search(rf"\b{re.escape(w)}\b", bio_norm):
-                return rubro
+    bio_norm = _normalize(bio or "")
+    for rubro, pattern in patterns.items():
+        if pattern is not None and pattern.search(bio_norm):
+            return rubro
 
     return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta
 from typing import Callable, TypeVar, Sequence, Optional, Tuple
 
@@ -27,18 +28,20 @@ T = TypeVar("T")
 log = get_logger("analyze_profile")
 
 
-def _avg(nums: Sequence[float | int]) -> float:
-    return float(sum(float(x) for x in nums) / len(nums)) if nums else 0.0
-
-
 def _compute_basic_stats_from_reels(reels: Sequence[ReelMetrics]) -> BasicStats:
-    views = [float(r.views or 0) for r in reels]
-    likes = [float(r.likes or 0) for r in reels]
-    comments = [float(r.comments or 0) for r in reels]
+    # Una sola pasada sobre los reels para los tres promedios
+    n = len(reels)
+    if not n:
+        return BasicStats()
+    views = likes = comments = 0.0
+    for r in reels:
+        views += float(r.views or 0)
+        likes += float(r.likes or 0)
+        comments += float(r.comments or 0)
     return BasicStats(
-        avg_views_last_n=_avg(views) or None,
-        avg_likes_last_n=_avg(likes) or None,
-        avg_comments_last_n=_avg(comments) or None,
+        avg_views_last_n=(views / n) or None,
+        avg_likes_last_n=(likes / n) or None,
+        avg_comments_last_n=(comments / n) or None,
         engagement_score=None,
         success_score=None,
     )
@@ -49,21 +52,20 @@ def _apply_success_metrics(snapshot: ProfileSnapshot, basic: Optional[BasicStats
         return None
     payload = {
         "username": snapshot.username,
-        "followers": int(snapshot.followers or 0),
-        "followings": int(snapshot.followings or 0),
-        "posts": int(snapshot.posts or 0),
-        "avg_likes": float(basic.avg_likes_last_n or 0.0),
-        "avg_comments": float(basic.avg_comments_last_n or 0.0),
-        "avg_views": float(basic.avg_views_last_n or 0.0),
+        "followers": snapshot.followers,
+        "followings": snapshot.followings,
+        "posts": snapshot.posts,
+        "avg_likes": basic.avg_likes_last_n,
+        "avg_comments": basic.avg_comments_last_n,
+        "avg_views": basic.avg_views_last_n,
     }
+    # evaluate_profile ya normaliza (None -> 0, int/float): no se convierte dos veces
     scores = evaluate_profile(payload)
-    return BasicStats(
-        avg_views_last_n=basic.avg_views_last_n,
-        avg_likes_last_n=basic.avg_likes_last_n,
-        avg_comments_last_n=basic.avg_comments_last_n,
-        engagement_score=(scores["engagement_score"] if scores else None),
-        success_score=(scores["success_score"] if scores else None),
-    )
+    # Los promedios no cambian: model_copy evita revalidar el modelo completo
+    return basic.model_copy(update={
+        "engagement_score": (scores["engagement_score"] if scores else None),
+        "success_score": (scores["success_score"] if scores else None),
+    })
 
 
 class AnalyzeProfileUseCase:
@@ -75,6 +77,12 @@ class AnalyzeProfileUseCase:
         3. Calcula estadísticas básicas y scores.
         4. Guarda (si se provee repo) el snapshot y análisis en BD.
         5. Retorna DTO con resultados.
+
+    Caché: una entrada con menos de `cache_fresh_s` se sirve como siempre (y se
+    re-guarda en BD). `cache_max_age_s` es el TTL en Redis, es decir, cuánto se
+    sigue sirviendo la entrada; por defecto igual a `cache_fresh_s`. Si se amplía,
+    entre ambos valores se sirve sin re-guardar en BD y nada la refresca: solo se
+    vuelve a analizar cuando Redis la expira. Solo se cachean análisis completados.
     """
     def __init__(
         self,
@@ -82,11 +90,15 @@ class AnalyzeProfileUseCase:
         profile_repo: Optional[ProfileRepository] = None,
         *,
         cache_service: Optional[CacheService] = None,
+        cache_fresh_s: int = 3600,
+        cache_max_age_s: Optional[int] = None,
         max_retries: int = 2,
     ) -> None:
         self.browser = browser
         self.profile_repo = profile_repo
         self.cache_service = cache_service
+        self.cache_fresh_s = cache_fresh_s
+        self.cache_max_age_s = max(cache_max_age_s or cache_fresh_s, cache_fresh_s)
         self.max_retries = max_retries
 
     def __call__(self, req: AnalyzeProfileRequest) -> AnalyzeProfileResponse:
@@ -97,16 +109,20 @@ class AnalyzeProfileUseCase:
         if self.cache_service:
             cached_analysis = self.cache_service.get_profile_analysis(username)
             if cached_analysis:
-                log.info("analyze_profile_cache_hit", username=username)
+                # Entradas previas a cached_at se consideran frescas (su TTL es el corto)
+                age = time.time() - float(cached_analysis.get("cached_at") or time.time())
+                stale = age >= self.cache_fresh_s
+                log.info("analyze_profile_cache_hit", username=username, age_s=int(age), stale=stale)
                 try:
                     # Deserializar respuesta completa desde caché
                     response = deserialize_analyze_profile_response(cached_analysis)
                     log.debug("analyze_profile_cache_deserialized", username=username)
                     
-                    # IMPORTANTE: También guardar en BD cuando hay cache hit
+                    # IMPORTANTE: También guardar en BD cuando hay cache hit fresco
                     # Esto asegura que el historial en BD esté completo, incluso si
-                    # el perfil solo se consulta desde caché (sin hacer scraping)
-                    if self.profile_repo and response.snapshot:
+                    # el perfil solo se consulta desde caché (sin hacer scraping).
+                    # Una entrada stale ya quedó guardada cuando estaba fresca.
+                    if self.profile_repo and response.snapshot and not stale:
                         try:
                             pid = self.profile_repo.upsert_profile(response.snapshot)
                             self.profile_repo.save_analysis_snapshot(
@@ -210,7 +226,9 @@ class AnalyzeProfileUseCase:
         if self.cache_service:
             try:
                 cache_data = serialize_analyze_profile_response(resp)
-                self.cache_service.set_profile_analysis(username, cache_data)
+                cache_data["cached_at"] = time.time()
+                # El TTL en Redis es la edad máxima servible; la frescura se decide con cached_at
+                self.cache_service.set_profile_analysis(username, cache_data, ttl=self.cache_max_age_s)
                 log.debug("analyze_profile_cache_saved", username=username)
             except Exception as e:
                 log.warning(
@@ -239,5 +257,5 @@ class AnalyzeProfileUseCase:
                 retryable = bool(getattr(e, "retryable", False))
                 if (not retryable) or (attempt > self.max_retries):
                     raise
-                import time, random
+                import random
                 time.sleep(max(0.3, 0.8 * attempt * (1 + random.uniform(-0.25, 0.25))))
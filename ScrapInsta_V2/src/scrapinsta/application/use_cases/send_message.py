@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import time
 import re
-from typing import Optional, Protocol
+from collections import OrderedDict
+from typing import Optional, Protocol, Tuple
 
 from scrapinsta.crosscutting.logging_config import get_logger
 from scrapinsta.application.dto.messages import (
@@ -27,6 +28,39 @@ from scrapinsta.crosscutting.retry import retry_auto, RetryError
 log = get_logger("send_message")
 
 
+class ProfileSnapshotCache:
+    """
+    Cache en proceso (TTL + LRU) de snapshots por username.
+    Evita re-navegar y re-upsertear el perfil en reintentos y re-envíos
+    dentro de la misma vida del worker.
+    """
+
+    def __init__(self, *, maxsize: int = 2048, ttl_s: float = 300.0) -> None:
+        self._maxsize = max(1, int(maxsize))
+        self._ttl_s = float(ttl_s)
+        self._data: "OrderedDict[str, Tuple[float, ProfileSnapshot]]" = OrderedDict()
+
+    def get(self, username: str) -> Optional[ProfileSnapshot]:
+        item = self._data.get(username)
+        if item is None:
+            return None
+        expires_at, snap = item
+        if time.monotonic() >= expires_at:
+            del self._data[username]
+            return None
+        self._data.move_to_end(username)
+        return snap
+
+    def put(self, username: str, snap: ProfileSnapshot) -> None:
+        self._data[username] = (time.monotonic() + self._ttl_s, snap)
+        self._data.move_to_end(username)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, username: str) -> None:
+        self._data.pop(username, None)
+
+
 class SendMessageUseCase:
     """
     Caso de uso: envío de mensajes directos (DM) en Instagram.
@@ -45,11 +79,13 @@ class SendMessageUseCase:
         sender: MessageSenderPort,
         composer: MessageComposerPort,
         profile_repo: Optional[ProfileRepository] = None,
+        snapshot_cache: Optional[ProfileSnapshotCache] = None,
     ) -> None:
         self._browser = browser
         self._sender = sender
         self._composer = composer
         self._repo = profile_repo
+        self._snapshots = snapshot_cache
 
     def __call__(self, req: MessageRequest) -> MessageResult:
         # Usar el username normalizado del DTO (ya validado por Pydantic)
@@ -58,27 +94,35 @@ class SendMessageUseCase:
         # Inicio de timing para métricas
         start_total = time.time()
         
-        # 1) Obtener snapshot actual del perfil (BrowserPort)
-        try:
-            start = time.time()
-            snap: ProfileSnapshot = self._browser.get_profile_snapshot(username)
-            snapshot_duration = time.time() - start
-            log.info("snapshot_obtained", username=username, duration_ms=round(snapshot_duration * 1000, 2))
-        except BrowserPortError as e:
-            log.error("snapshot_failed", username=username, error=str(e))
-            return MessageResult(
-                success=False, 
-                error=f"snapshot failed: {e}", 
-                attempts=0,
-                target_username=username
-            )
+        # 1) Obtener snapshot del perfil: cache en proceso o BrowserPort
+        cached = self._snapshots.get(username) if self._snapshots is not None else None
+        if cached is not None:
+            snap: ProfileSnapshot = cached
+            log.info("snapshot_cache_hit", username=username)
+        else:
+            try:
+                start = time.time()
+                snap = self._browser.get_profile_snapshot(username)
+                snapshot_duration = time.time() - start
+                log.info("snapshot_obtained", username=username, duration_ms=round(snapshot_duration * 1000, 2))
+            except BrowserPortError as e:
+                log.error("snapshot_failed", username=username, error=str(e))
+                return MessageResult(
+                    success=False, 
+                    error=f"snapshot failed: {e}", 
+                    attempts=0,
+                    target_username=username
+                )
 
-        # Upsert opcional del snapshot
-        try:
-            if self._repo:
-                self._repo.upsert_profile(snap)
-        except Exception as e:
-            log.warning("profile_upsert_failed_non_fatal", username=username, error=str(e))
+            # Upsert opcional del snapshot (sólo si es nuevo: el cacheado ya se guardó)
+            try:
+                if self._repo:
+                    self._repo.upsert_profile(snap)
+            except Exception as e:
+                log.warning("profile_upsert_failed_non_fatal", username=username, error=str(e))
+
+            if self._snapshots is not None:
+                self._snapshots.put(username, snap)
 
         # 2) Componer o usar mensaje proporcionado
         start = time.time()
@@ -160,6 +204,9 @@ class SendMessageUseCase:
             total_duration = time.time() - start_total
             
             if ok:
+                # Enviado: el próximo contacto debe ver el perfil actualizado
+                if self._snapshots is not None:
+                    self._snapshots.pop(username)
                 log.info("send_success", username=username, attempts=attempts, total_ms=round(total_duration * 1000, 2))
                 return MessageResult(success=True, attempts=attempts, target_username=username)
             
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from dotenv import load_dotenv
 from typing import Optional, List, Dict, Any
 from urllib.parse import urlparse, quote_plus
+from functools import lru_cache
 import json, os
 
 from scrapinsta.crosscutting.logging_config import get_logger
@@ -22,6 +23,15 @@ log = get_logger("settings")
 # Calcula la raíz del proyecto (sube dos niveles desde scrapinsta/config/settings.py)
 BASE_DIR = Path(__file__).resolve().parents[2]
 
+# Tabla de palabras clave por rubro (vive junto a este módulo)
+KEYWORDS_PATH = Path(__file__).resolve().parent / "keywords.json"
+
+
+@lru_cache(maxsize=1)
+def load_keywords() -> Dict[str, Any]:
+    """Lee y parsea keywords.json una sola vez por proceso (datos crudos, sin normalizar)."""
+    return json.loads(KEYWORDS_PATH.read_text(encoding="utf-8"))
+
 # -----------------------------
 # Modelos auxiliares
 # -----------------------------
@@ -210,6 +220,9 @@ class Settings(BaseSettings):
     # --- Redis Cache TTLs ---
     redis_cache_profile_ttl: int = Field(default=3600, env="REDIS_CACHE_PROFILE_TTL")  # 1 hora
     redis_cache_analysis_ttl: int = Field(default=3600, env="REDIS_CACHE_ANALYSIS_TTL")  # 1 hora
+    # Cuánto se sirve un análisis cacheado (pasado REDIS_CACHE_PROFILE_TTL sin re-guardar en BD
+    # ni refrescarse). None = REDIS_CACHE_PROFILE_TTL
+    redis_cache_profile_max_age: Optional[int] = Field(default=None, env="REDIS_CACHE_PROFILE_MAX_AGE")
     
     # --- Secrets Management ---
     secrets_provider: Optional[str] = Field(default=None, env="SECRETS_PROVIDER")
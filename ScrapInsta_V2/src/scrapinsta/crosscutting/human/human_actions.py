@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import random
-from typing import Optional
+import time
+from typing import List, Optional, Tuple
 
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
@@ -53,6 +55,53 @@ def hover_element_human(
         log.debug("hover_element_failed_non_fatal", error=str(e))
 
 
+# Ejecuta el plan [[dy, pausa_ms], ...] en el navegador: un solo round-trip
+# en vez de un execute_script + sleep en Python por paso
+_JS_SCROLL_PLAN = r"""
+const plan = arguments[0];
+const done = arguments[arguments.length - 1];
+let i = 0;
+const step = () => {
+    if (i >= plan.length) { done(true); return; }
+    const [dy, ms] = plan[i++];
+    window.scrollBy(0, dy);
+    setTimeout(step, ms);
+};
+step();
+"""
+
+
+def _scroll_plan(
+    total_px: int,
+    duration: float,
+    min_step_px: int,
+    max_step_px: int,
+    occasional_back_scroll: bool,
+) -> List[Tuple[int, int]]:
+    """Pasos (delta_px, pausa_ms) con la misma curva y jitter que el scroll paso a paso."""
+    steps = max(1, int(total_px / max(1, (min_step_px + max_step_px) // 2)))
+    if steps <= 1:
+        steps = 2  # mínimo para variabilidad
+
+    per_step = max(0.02, duration / max(1, steps))
+    plan: List[Tuple[int, int]] = []
+    for i in range(steps):
+        # Curva de aceleración simplificada
+        t = i / max(1, (steps - 1))
+        accel = 3 * t**2 - 2 * t**3
+
+        step = random.randint(min_step_px, max_step_px)
+        delta = int(step * (0.7 + 0.6 * accel))
+        # Pausa mínima entre pasos
+        plan.append((delta, int(tempo.jitter_delay(per_step, 0.3) * 1000)))
+
+        # Back-scroll solo si está activado (1 de cada ~10 pasos)
+        if occasional_back_scroll and i > 0 and random.random() < 0.1:
+            back = random.randint(8, 20)
+            plan.append((-back, int(tempo.jitter_delay(0.02, 0.3) * 1000)))
+    return plan
+
+
 def human_scroll(
     driver: WebDriver,
     *,
@@ -68,30 +117,19 @@ def human_scroll(
     - Pasos grandes para menos operaciones.
     - Pausas mínimas entre pasos.
     - Back-scroll desactivado por defecto.
+    - El plan de pasos se arma en Python y se ejecuta en el navegador con un solo
+      execute_async_script; si el driver no lo soporta, se aplica paso a paso.
     """
     if scheduler:
         scheduler.wait_turn()
 
-    steps = max(1, int(total_px / max(1, (min_step_px + max_step_px) // 2)))
-    if steps <= 1:
-        steps = 2  # mínimo para variabilidad
-
-    for i in range(steps):
-        # Curva de aceleración simplificada
-        t = i / max(1, (steps - 1))
-        accel = 3 * t**2 - 2 * t**3
-
-        step = random.randint(min_step_px, max_step_px)
-        delta = int(step * (0.7 + 0.6 * accel))
+    plan = _scroll_plan(total_px, duration, min_step_px, max_step_px, occasional_back_scroll)
+    try:
+        driver.execute_async_script(_JS_SCROLL_PLAN, [list(p) for p in plan])
+        return
+    except WebDriverException as e:
+        log.debug("human_scroll_async_failed", error=str(e))
 
+    for delta, pause_ms in plan:
         driver.execute_script("window.scrollBy(0, arguments[0]);", delta)
-
-        # Pausa mínima entre pasos
-        per_step = max(0.02, duration / max(1, steps))
-        tempo.sleep_jitter(per_step, 0.3)
-
-        # Back-scroll solo si está activado (1 de cada ~10 pasos)
-        if occasional_back_scroll and i > 0 and random.random() < 0.1:
-            back = random.randint(8, 20)
-            driver.execute_script("window.scrollBy(0, arguments[0]);", -back)
-            tempo.sleep_jitter(0.02, 0.3)
+        time.sleep(pause_ms / 1000.0)
@@ -131,13 +131,10 @@ class HumanScheduler:
             log.debug("human_backoff_decayed", before_s=round(before, 2), after_s=round(self._human_backoff, 2), decay=decay)
 
 
-def sleep_jitter(base: float, jitter: float = 0.35, mode: str = "uniform", *, max_factor: float = 3.0) -> None:
+def jitter_delay(base: float, jitter: float = 0.35, mode: str = "uniform", *, max_factor: float = 3.0) -> float:
     """
-    Pausa con jitter “humano”.
-    - base: segundos base.
-    - jitter: intensidad del jitter.
-    - mode: "uniform" (±jitter relativo) | "lognormal" (sesgo a derecha).
-    - max_factor: cota superior para evitar sleeps excesivos (base*max_factor).
+    Duración con jitter “humano” (sin dormir); misma distribución que sleep_jitter.
+    Sirve para planificar varias pausas de antemano (p.ej. para ejecutarlas en el navegador).
     """
     base = max(0.05, float(base))
     if mode == "lognormal":
@@ -148,6 +145,16 @@ def sleep_jitter(base: float, jitter: float = 0.35, mode: str = "uniform", *, ma
     else:
         delay = base * (1.0 + random.uniform(-jitter, jitter))
 
-    delay = max(0.02, min(delay, base * max_factor))
-    time.sleep(delay)
+    return max(0.02, min(delay, base * max_factor))
+
+
+def sleep_jitter(base: float, jitter: float = 0.35, mode: str = "uniform", *, max_factor: float = 3.0) -> None:
+    """
+    Pausa con jitter “humano”.
+    - base: segundos base.
+    - jitter: intensidad del jitter.
+    - mode: "uniform" (±jitter relativo) | "lognormal" (sesgo a derecha).
+    - max_factor: cota superior para evitar sleeps excesivos (base*max_factor).
+    """
+    time.sleep(jitter_delay(base, jitter, mode, max_factor=max_factor))
 
@@ -4,7 +4,7 @@ import random
 import time
 import os
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Iterable, Optional, Tuple, Type, TypeVar, Literal
 
 from scrapinsta.config.settings import Settings
@@ -42,9 +42,12 @@ class _RetryByResult(RuntimeError):
 # --------------------------------------------------------------------------------------
 # Helpers de política/tiempos
 # --------------------------------------------------------------------------------------
+@lru_cache(maxsize=1)
 def _policy_from_settings() -> RetryPolicy:
     """
     Obtiene la política desde Settings(), usando defaults seguros si faltan campos.
+    Se resuelve una vez por proceso: construir Settings() (env + secretos, ~ms) en
+    cada llamada decorada encarecía cada query. Tests: _policy_from_settings.cache_clear().
     """
     s = Settings()
     # Fallbacks seguros si el Settings no define alguno
@@ -116,7 +119,7 @@ def retry(
     Decorador de reintentos con backoff y jitter.
 
     - `exceptions`: excepción o tupla/iterable de excepciones a reintentar.
-    - Parámetros None se resuelven desde Settings() en **cada llamada** (permite ajustar por env sin reinstanciar).
+    - Parámetros None se resuelven desde Settings() la primera vez y se cachean por proceso.
     - `jitter_strategy`: "relative" (legacy), "full" o "decorrelated".
     - `max_elapsed`: deadline total en segundos (opcional).
     - `retry_if_result`: predicado para reintentar según el resultado (p.ej. lista vacía).
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable, Iterable, Optional
+from typing import Protocol, runtime_checkable, Iterable, Optional, Sequence
 from scrapinsta.domain.models.profile_models import Username, Following
 
 # =========================
@@ -74,3 +74,13 @@ class FollowingsRepo(Protocol):
         """
         ...
 
+    def get_for_owners(
+        self,
+        owners: Sequence[Username],
+        limit_per: int | None = None,
+    ) -> dict[str, list[Following]]:
+        """
+        Versión batch de get_for_owner: devuelve {owner: followings} para varios owners
+        en una sola operación. Si 'limit_per' > 0, recorta el resultado de cada owner.
+        """
+        ...
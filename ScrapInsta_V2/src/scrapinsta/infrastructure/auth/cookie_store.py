@@ -1,14 +1,30 @@
 from __future__ import annotations
-import json, time, os
+import time, os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from selenium.webdriver.support.ui import WebDriverWait
+
+import orjson
+
 from scrapinsta.config.settings import Settings
 from scrapinsta.crosscutting.logging_config import get_logger
 
 log = get_logger("cookie_store")
 
+# ruta -> ((st_mtime_ns, st_size, st_ino), hay_sessionid, expiry); se invalida al cambiar
+# el archivo (size/ino cubren reescrituras dentro de la resolución del mtime y os.replace).
+# Se guarda el expiry (no el bool final) para que la expiración se evalúe en cada llamada.
+_StatKey = Tuple[int, int, int]
+_sessionid_cache: Dict[str, Tuple[_StatKey, bool, Optional[int]]] = {}
+
+@lru_cache(maxsize=1)
 def cookies_dir() -> Path:
-    """Devuelve el directorio donde se guardan las cookies (según settings)."""
+    """
+    Devuelve el directorio donde se guardan las cookies (según settings).
+    Se resuelve una sola vez por proceso: construir Settings() relee env/secretos
+    y cookie_path() se llama en cada has_sessionid/load/save. Tests: cookies_dir.cache_clear().
+    """
     settings = Settings()
     base = settings.get_data_dir()  # siempre resuelve y crea <data_dir>
     cookies = base / "cookies"
@@ -34,46 +50,134 @@ def _normalize_expiry(cookie: Dict[str, Any]) -> Optional[int]:
         pass
     return None
 
+_ALLOWED_COOKIE_KEYS = frozenset(
+    ("name", "value", "domain", "path", "expiry", "httpOnly", "secure", "sameSite")
+)
+
 def _filter_cookie_fields(cookie: Dict[str, Any]) -> Dict[str, Any]:
-    allowed = {"name", "value", "domain", "path", "expiry", "httpOnly", "secure", "sameSite"}
-    filtered = {k: v for k, v in cookie.items() if k in allowed}
-    filtered.setdefault("path", "/")
+    """Deja sólo los campos que acepta add_cookie. Muta y devuelve el mismo dict."""
+    for key in cookie.keys() - _ALLOWED_COOKIE_KEYS:
+        del cookie[key]
+    cookie.setdefault("path", "/")
 
-    exp = _normalize_expiry(filtered)
+    exp = _normalize_expiry(cookie)
     if exp is not None:
-        filtered["expiry"] = exp
+        cookie["expiry"] = exp
     else:
-        filtered.pop("expiry", None)
+        cookie.pop("expiry", None)
 
     for key in ("httpOnly", "secure"):
-        if key in filtered and isinstance(filtered[key], str):
-            filtered[key] = filtered[key].lower() == "true"
+        if key in cookie and isinstance(cookie[key], str):
+            cookie[key] = cookie[key].lower() == "true"
+
+    return cookie
+
+def _read_sessionid(path: Path) -> Tuple[bool, Optional[int]]:
+    """
+    Devuelve (hay_sessionid, expiry) considerando todas las cookies 'sessionid' del archivo
+    (p.ej. una por dominio): el expiry es el mayor, y None si alguna no expira.
+    """
+    data = orjson.loads(path.read_bytes())
+    cookies = data if isinstance(data, list) else []
+    found = False
+    best: Optional[int] = None
+    for c in cookies:
+        if not isinstance(c, dict) or c.get("name") != "sessionid":
+            continue
+        exp = _normalize_expiry(c)
+        if exp is None:
+            return True, None
+        best = exp if best is None else max(best, exp)
+        found = True
+    return found, best
+
+def _stat_key(st: os.stat_result) -> _StatKey:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _sessionid_valid(path: Path, stat_key: _StatKey, now: int) -> bool:
+    """Evalúa el sessionid de `path` usando el cache por stat (lee el archivo sólo si cambió)."""
+    key = str(path)
+    cached = _sessionid_cache.get(key)
+    if cached is not None and cached[0] == stat_key:
+        found, exp = cached[1], cached[2]
+    else:
+        try:
+            found, exp = _read_sessionid(path)
+        except Exception as e:
+            log.warning("cookies_read_failed", path=str(path), error=str(e))
+            return False
+        _sessionid_cache[key] = (stat_key, found, exp)
 
-    return filtered
+    return found and (exp is None or exp > now)
 
 def has_sessionid(username: str) -> bool:
     path = cookie_path(username)
-    if not path.exists():
-        return False
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        now = int(time.time())
-        for c in data if isinstance(data, list) else []:
-            if c.get("name") == "sessionid":
-                exp = _normalize_expiry(c)
-                if exp is None or exp > now:
-                    return True
-        return False
-    except Exception as e:
-        log.warning("cookies_read_failed", path=str(path), error=str(e))
+        stat_key = _stat_key(path.stat())
+    except OSError:
         return False
+    return _sessionid_valid(path, stat_key, int(time.time()))
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """
+    Escribe en <path>.tmp, fsync y os.replace: un crash nunca deja un JSON a medias
+    (que forzaría un re-login). En POSIX también se fsyncea el directorio.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if os.name == "posix":
+        try:
+            dir_fd = os.open(path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
 
 def save_cookies(driver, username: str) -> None:
     path = cookie_path(username)
     cookies = driver.get_cookies()
-    path.write_text(json.dumps(cookies, indent=2, ensure_ascii=False), encoding="utf-8")
+    _atomic_write_bytes(path, orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
     log.info("cookies_saved", username=username, path=str(path))
 
+def _to_cdp_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """Convierte una cookie (formato WebDriver) al esquema CookieParam de CDP."""
+    out = {k: cookie[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly") if k in cookie}
+    if "expiry" in cookie:
+        out["expires"] = float(cookie["expiry"])
+    same_site = cookie.get("sameSite")
+    if isinstance(same_site, str) and same_site.lower() in ("strict", "lax", "none"):
+        out["sameSite"] = same_site.capitalize()
+    return out
+
+def _set_cookies_cdp(driver, cookies: List[Dict[str, Any]]) -> bool:
+    """
+    Restaura todas las cookies con un único Network.setCookies (un round-trip en vez
+    de uno por cookie). Devuelve False si el driver no es Chromium o CDP falla.
+    """
+    if not cookies:
+        return False
+    execute = getattr(driver, "execute_cdp_cmd", None)
+    if not callable(execute):
+        return False
+    try:
+        execute("Network.setCookies", {"cookies": [_to_cdp_cookie(c) for c in cookies]})
+        return True
+    except Exception as e:
+        log.debug("cookies_cdp_set_failed", error=str(e))
+        return False
+
 def load_cookies(driver, username: str, *, base_url: str = "https://www.instagram.com/", require_sessionid: bool = True) -> bool:
     path = cookie_path(username)
     if not path.exists():
@@ -81,7 +185,7 @@ def load_cookies(driver, username: str, *, base_url: str = "https://www.instagra
         return False
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
         if not isinstance(data, list):
             log.warning("cookies_file_invalid", path=str(path))
             return False
@@ -90,25 +194,44 @@ def load_cookies(driver, username: str, *, base_url: str = "https://www.instagra
             log.info("cookies_missing_or_expired_sessionid", username=username)
             return False
 
-        try:
-            driver.get(base_url)
-        except Exception:
-            log.debug("cookies_preload_nav_failed", base_url=base_url)
-
-        loaded = 0
+        cookies = []
         for c in data:
             try:
                 cookie = _filter_cookie_fields(c)
-                if not cookie.get("name") or cookie.get("value") is None:
-                    continue
-                if not cookie.get("domain"):
-                    cookie["domain"] = ".instagram.com"
-                driver.add_cookie(cookie)
-                loaded += 1
             except Exception:
-                log.debug("cookie_add_failed", name=c.get("name"))
-
-        log.info("cookies_loaded", username=username, loaded=loaded)
+                log.debug("cookie_invalid_skipped")
+                continue
+            if not cookie.get("name") or cookie.get("value") is None:
+                continue
+            if not cookie.get("domain"):
+                cookie["domain"] = ".instagram.com"
+            cookies.append(cookie)
+
+        if _set_cookies_cdp(driver, cookies):
+            loaded = len(cookies)
+            mode = "cdp"
+        else:
+            loaded = 0
+            mode = "webdriver"
+            # add_cookie exige estar en el dominio de la cookie; CDP no, por eso
+            # sólo se navega en este fallback (los callers navegan después igual)
+            try:
+                driver.get(base_url)
+                # Con pageLoadStrategy "none" get vuelve antes de cambiar de dominio
+                host = base_url.split("//", 1)[-1].split("/", 1)[0]
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    lambda d: host in (d.current_url or "")
+                )
+            except Exception:
+                log.debug("cookies_preload_nav_failed", base_url=base_url)
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                    loaded += 1
+                except Exception:
+                    log.debug("cookie_add_failed", name=cookie.get("name"))
+
+        log.info("cookies_loaded", username=username, loaded=loaded, mode=mode)
         return loaded > 0
 
     except Exception as e:
@@ -118,6 +241,7 @@ def load_cookies(driver, username: str, *, base_url: str = "https://www.instagra
 def clear_cookies_file(username: str) -> None:
     path = cookie_path(username)
     try:
+        _sessionid_cache.pop(str(path), None)
         if path.exists():
             path.unlink()
             log.info("cookies_file_deleted", username=username, path=str(path))
@@ -11,9 +11,11 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     ElementClickInterceptedException,
+    WebDriverException,
 )
 
 from scrapinsta.infrastructure.auth.cookie_store import save_cookies, clear_cookies_file
+from scrapinsta.infrastructure.browser.core.browser_utils import wait_dom_interactive, wait_for_any_xpath
 from scrapinsta.domain.ports.browser_port import BrowserAuthError
 from scrapinsta.crosscutting.logging_config import get_logger
 
@@ -28,6 +30,27 @@ except Exception:
 
 log = get_logger("login_flow")
 
+_HOME_LINK_XPATH = (
+    "//a[contains(@href,'/direct/inbox/') or contains(@href,'/accounts/edit') or contains(@href,'/explore/')]"
+)
+_TWO_FACTOR_XPATH = "//input[@name='verificationCode' or @name='otpCode']"
+
+# Mismas variantes (y prioridad) que _locate_inputs, resueltas en un solo execute_script
+_LOGIN_INPUTS_JS = """
+const pick = (sels) => {
+  for (const s of sels) {
+    const el = document.querySelector(s);
+    if (el) return el;
+  }
+  return null;
+};
+return [
+  pick(["input[name='username']", "input[name='email']",
+        "input[autocomplete*='username']", "input[type='text'][name]"]),
+  pick(["input[name='password']", "input[name='pass']", "input[type='password']"]),
+];
+"""
+
 
 def _maybe_wait(scheduler: Optional[HumanScheduler]) -> None:
     if scheduler is None:
@@ -109,35 +132,75 @@ def _on_login_page(driver: WebDriver) -> bool:
     return url.endswith("instagram.com/accounts/login") or "/accounts/login" in url
 
 
+_LOGGED_IN_XPATHS = (
+    "//a[contains(@href,'/direct/inbox/')]",
+    "//a[contains(@href,'/accounts/edit')]",
+    "//a[contains(@href,'/explore/')]",
+    "//button[contains(.,'Log out') or contains(.,'Cerrar sesión')]",
+)
+
+_SAVE_LOGIN_INFO_XPATHS = (
+    "//button[normalize-space()='Not Now']",
+    "//div[@role='dialog']//button[normalize-space()='Ahora no']",
+)
+
+
 def _is_logged_in(driver: WebDriver, timeout: int = 12) -> bool:
-    """Señales inequívocas de sesión activa."""
+    """
+    Señales inequívocas de sesión activa.
+    Espera en el navegador (un round-trip); si el script no puede correr,
+    cae al polling de WebDriverWait.
+    """
+    deadline = time.monotonic() + timeout
+    wait_dom_interactive(driver, url_contains="instagram.com", timeout=timeout)
+    remaining = max(0.5, deadline - time.monotonic())
+    idx = wait_for_any_xpath(driver, _LOGGED_IN_XPATHS, timeout=remaining)
+    if idx is not None:
+        return idx >= 0
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.any_of(
-                EC.presence_of_element_located((By.XPATH, "//a[contains(@href,'/direct/inbox/')]")),
-                EC.presence_of_element_located((By.XPATH, "//a[contains(@href,'/accounts/edit')]")),
-                EC.presence_of_element_located((By.XPATH, "//a[contains(@href,'/explore/')]")),
-                EC.presence_of_element_located((By.XPATH, "//button[contains(.,'Log out') or contains(.,'Cerrar sesión')]")),
-            )
+        WebDriverWait(driver, max(0.5, deadline - time.monotonic())).until(
+            EC.any_of(*(EC.presence_of_element_located((By.XPATH, xp)) for xp in _LOGGED_IN_XPATHS))
         )
         return True
     except TimeoutException:
         return False
 
 
+def _find_two_factor_input(driver: WebDriver, timeout: int = 6):
+    """
+    Espera a que aparezca el challenge 2FA *o* la home; devuelve el input 2FA o None.
+    Con sesión ya iniciada retorna en cuanto la home renderiza, sin agotar el timeout.
+    """
+    try:
+        el = WebDriverWait(driver, timeout).until(
+            EC.any_of(
+                EC.presence_of_element_located((By.XPATH, _TWO_FACTOR_XPATH)),
+                EC.presence_of_element_located((By.XPATH, _HOME_LINK_XPATH)),
+            )
+        )
+    except TimeoutException:
+        return None
+    name = (el.get_attribute("name") or "").strip()
+    return el if name in ("verificationCode", "otpCode") else None
+
+
 def _handle_save_login_info_popup(
     driver: WebDriver,
     *,
     scheduler: Optional[HumanScheduler] = None,
     timeout: int = 6,
 ) -> None:
-    """Descarta popup 'Guardar información de inicio de sesión' si aparece."""
+    """
+    Descarta popup 'Guardar información de inicio de sesión' si aparece.
+    La aparición se espera en el navegador; el WebDriverWait solo resuelve el botón.
+    """
+    idx = wait_for_any_xpath(driver, _SAVE_LOGIN_INFO_XPATHS, timeout=timeout)
+    if idx == -1:
+        log.debug("auth_save_login_info_popup_not_present")
+        return
     try:
-        btn = WebDriverWait(driver, timeout).until(
-            EC.any_of(
-                EC.element_to_be_clickable((By.XPATH, "//button[normalize-space()='Not Now']")),
-                EC.element_to_be_clickable((By.XPATH, "//div[@role='dialog']//button[normalize-space()='Ahora no']")),
-            )
+        btn = WebDriverWait(driver, timeout if idx is None else 2).until(
+            EC.any_of(*(EC.element_to_be_clickable((By.XPATH, xp)) for xp in _SAVE_LOGIN_INFO_XPATHS))
         )
         _maybe_wait(scheduler)
         btn.click()
@@ -171,13 +234,36 @@ def _paste_text(el, text: str, *, scheduler: Optional[HumanScheduler] = None) ->
     _hsleep(0.1, 0.2)
 
 
+def _query_login_inputs(driver: WebDriver):
+    """Ambos inputs de login en un round-trip; False mientras falte alguno (apto para until)."""
+    found = driver.execute_script(_LOGIN_INPUTS_JS)
+    if isinstance(found, (list, tuple)) and len(found) == 2 and all(found):
+        return found[0], found[1]
+    return False
+
+
 def _locate_inputs(driver: WebDriver, wait_s: int) -> Tuple:
     """
     Localiza inputs de login.
     Instagram cambia frecuentemente los atributos; soportamos variantes comunes:
     - user: name="username" (legacy) o name="email" (actual), autocomplete="username"
     - pass: name="password" (legacy) o name="pass" (actual)
+
+    Cada sondeo es un único execute_script (en vez de un find_element por selector);
+    si el script falla se cae a los waits por elemento.
     """
+    try:
+        return WebDriverWait(driver, wait_s).until(_query_login_inputs)
+    except TimeoutException:
+        log.error(
+            "auth_login_inputs_not_found",
+            url=(driver.current_url or ""),
+            title=(getattr(driver, "title", "") or ""),
+        )
+        raise
+    except WebDriverException as e:
+        log.debug("auth_login_inputs_batch_query_failed", error=str(e))
+
     wait = WebDriverWait(driver, wait_s)
 
     # Username/email (usar any_of para evitar timeouts secuenciales largos)
@@ -345,8 +431,10 @@ def login_instagram(
     try:
         _maybe_wait(scheduler)
         driver.get(login_url)
+        wait_dom_interactive(driver, url_contains="/accounts/login", timeout=wait_s)
         log.debug("auth_nav_login_url", url=login_url)
-        _hsleep(1.0, 2.0)
+        # La espera real la hacen los WebDriverWait siguientes; aquí sólo jitter humano
+        _hsleep(0.3, 0.7)
         _accept_cookies_banner(driver, scheduler=scheduler)
 
         user_input, pass_input = _locate_inputs(driver, wait_s)
@@ -366,11 +454,11 @@ def login_instagram(
                 log.debug("auth_submit_plan_a_failed_fallback", error=str(e))
                 _click_submit_fallbacks(driver, pass_input, login_url, scheduler=scheduler)
 
-            _hsleep(0.6, 1.0)
+            _hsleep(0.3, 0.7)
             try:
                 WebDriverWait(driver, 18).until(
                     EC.any_of(
-                        EC.presence_of_element_located((By.XPATH, "//a[contains(@href,'/direct/inbox/') or contains(@href,'/accounts/edit') or contains(@href,'/explore/')]")),
+                        EC.presence_of_element_located((By.XPATH, _HOME_LINK_XPATH)),
                         EC.presence_of_element_located((By.XPATH, "//*[@role='alert' or @id='slfErrorAlert']")),
                         EC.url_changes(login_url),
                     )
@@ -392,28 +480,29 @@ def login_instagram(
             log.warning("auth_login_stuck_on_login_page", username=username, message=msg)
             raise BrowserAuthError(msg, username=username)
 
-        try:
-            challenge = WebDriverWait(driver, 6).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@name='verificationCode' or @name='otpCode']"))
-            )
-            if challenge is not None:
-                log.info("auth_two_factor_required", username=username)
-                if two_factor_code_provider is None:
-                    raise BrowserAuthError("Se requiere 2FA y no hay proveedor de código", username=username)
-                code = (two_factor_code_provider() or "").strip()
-                if not code:
-                    raise BrowserAuthError("Código 2FA vacío", username=username)
-                _maybe_wait(scheduler)
-                challenge.clear()
-                for ch in code:
-                    challenge.send_keys(ch)
-                    time.sleep(random.uniform(0.03, 0.08))
-                _hsleep(0.3, 0.6)
-                WebDriverWait(driver, 8).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[@type='button' or @type='submit']"))
-                ).click()
-                _hsleep(1.0, 1.5)
-        except TimeoutException:
+        challenge = _find_two_factor_input(driver)
+        if challenge is not None:
+            log.info("auth_two_factor_required", username=username)
+            if two_factor_code_provider is None:
+                raise BrowserAuthError("Se requiere 2FA y no hay proveedor de código", username=username)
+            code = (two_factor_code_provider() or "").strip()
+            if not code:
+                raise BrowserAuthError("Código 2FA vacío", username=username)
+            _maybe_wait(scheduler)
+            challenge.clear()
+            for ch in code:
+                challenge.send_keys(ch)
+                time.sleep(random.uniform(0.03, 0.08))
+            _hsleep(0.3, 0.6)
+            WebDriverWait(driver, 8).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[@type='button' or @type='submit']"))
+            ).click()
+            try:
+                # El input desaparece al aceptar el código; la verificación final confirma la sesión
+                WebDriverWait(driver, 15).until(EC.staleness_of(challenge))
+            except TimeoutException:
+                log.debug("auth_two_factor_input_still_present", username=username)
+        else:
             log.debug("auth_two_factor_not_detected")
 
         _handle_save_login_info_popup(driver, scheduler=scheduler)
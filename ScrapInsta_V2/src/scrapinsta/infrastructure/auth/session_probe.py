@@ -1,12 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from urllib.parse import urlsplit
 
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from scrapinsta.infrastructure.browser.core.browser_utils import wait_dom_interactive
 
 logger = logging.getLogger(__name__)
 
@@ -26,27 +23,6 @@ def _has_session_cookie(driver) -> bool:
     return False
 
 
-def _looks_like_login_page(driver, timeout: float) -> bool:
-    """
-    Heurística 2: detectar la UI de login.
-    Buscamos campos del formulario de login. Si aparecen rápido, asumimos que NO hay sesión.
-    Si no aparecen y tampoco fallan los waits, asumimos que probablemente sí hay sesión.
-    """
-    try:
-        wait = WebDriverWait(driver, timeout)
-        login_username = wait.until(
-            EC.presence_of_all_elements_located((By.NAME, "username"))
-        )
-        if login_username:
-            return True
-    except TimeoutException:
-        return False
-    except WebDriverException:
-        logger.debug("session_probe: error sondando DOM login", exc_info=True)
-        return False
-    return False
-
-
 def has_active_session_in_driver(
     driver,
     *,
@@ -57,24 +33,21 @@ def has_active_session_in_driver(
     Devuelve True si el driver parece tener una sesión activa de Instagram.
 
     Estrategia:
-      1) Navegar al home (best-effort).
+      1) Navegar al home (best-effort) y esperar hasta `timeout_s` a que el
+         documento de ese host tenga DOM (con pageLoadStrategy "none" get()
+         vuelve sobre el documento en blanco/anterior).
       2) Si ya hay cookie de sesión conocida -> True.
-      3) Si NO hay cookie, inspeccionar DOM para ver si carga la pantalla de login -> False si es login.
+      3) Si NO hay cookie -> False.
 
     Notas:
       - Es una heurística conservadora (preferimos no forzar login si ya hay sesión).
-      - No levanta excepciones: ante dudas, intenta ser permisivo y devolver False sólo si vemos el login.
+      - No levanta excepciones.
+      - No espera elementos del home: sin cookie el resultado es False aunque cargue el form de login.
     """
     try:
         driver.get(base_url)
     except Exception:
         logger.debug("session_probe: error navegando a %s", base_url, exc_info=True)
+    wait_dom_interactive(driver, url_contains=urlsplit(base_url).hostname or "", timeout=timeout_s)
 
-    if _has_session_cookie(driver):
-        return True
-
-
-    if _looks_like_login_page(driver, timeout=timeout_s):
-        return False
-
-    return False
+    return _has_session_cookie(driver)
@@ -6,9 +6,12 @@ contiene utilidades comunes, creación/configuración del driver y su ciclo de v
 from .core.browser_utils import (
     detect_chrome_major,
     parse_proxy,
+    probe_proxy_egress,
     quick_probe,
     safe_quit,
     safe_username,
+    wait_dom_interactive,
+    wait_for_any_xpath,
 )
 from .core.driver_factory import build_chrome_options
 from .core.driver_provider import DriverProvider, DriverManagerError
@@ -17,9 +20,12 @@ __all__ = [
     # browser_utils
     "detect_chrome_major",
     "parse_proxy",
+    "probe_proxy_egress",
     "quick_probe",
     "safe_quit",
     "safe_username",
+    "wait_dom_interactive",
+    "wait_for_any_xpath",
     # driver_factory
     "build_chrome_options",
     # driver_provider
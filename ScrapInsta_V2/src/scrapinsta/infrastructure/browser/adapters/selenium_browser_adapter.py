@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
 from typing import Callable, Optional, Tuple, List, Sequence, Set
 
@@ -35,12 +36,96 @@ from scrapinsta.crosscutting.metrics import (
     browser_action_duration_seconds,
 )
 
+from scrapinsta.infrastructure.browser.core.browser_utils import wait_dom_interactive
 from scrapinsta.infrastructure.browser.pages import profile_page, reels_page
 
 logger = logging.getLogger(__name__)
 
 FOLLOWING_DIALOG_XPATH = "//div[@role='dialog']"
 FOLLOWING_BUTTON_XPATH = "//a[contains(@href, '/following')]"
+# Links de las filas del modal: relativos y de la forma "/<username>/"
+FOLLOWING_ROW_LINK_CSS = "a[role='link'][href^='/'][href$='/']"
+
+# Localiza el modal y su contenedor scrolleable una sola vez y los deja en
+# window.__ig_scroll_ctx; se recalcula solo si los nodos ya no están en el DOM
+# (equivalente JS de un StaleElementReference).
+_SCROLL_CTX_JS = r"""
+const __igScrollCtx = (xp) => {
+    const c = window.__ig_scroll_ctx;
+    if (c && c.dlg.isConnected && c.target.isConnected) return c;
+    const dlg = document.evaluate(xp, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!dlg) { window.__ig_scroll_ctx = null; return null; }
+    let target = null;
+    for (const n of dlg.querySelectorAll('div')) {
+        if (n.scrollHeight > n.clientHeight + 8) { target = n; break; }
+    }
+    // Sin scroller todavía (lista sin cargar) no se cachea: se reintenta en el próximo tick
+    const ctx = {dlg: dlg, target: target || dlg};
+    window.__ig_scroll_ctx = target ? ctx : null;
+    return ctx;
+};
+"""
+
+# Scroll + extracción del modal en una sola llamada async: un MutationObserver
+# recoge los links nuevos mientras un timer con intervalos aleatorios scrollea.
+# Resuelve al llegar a maxItems, al agotar maxMs o tras idleMs sin crecimiento.
+_COLLECT_FOLLOWINGS_ASYNC_JS = _SCROLL_CTX_JS + r"""
+const xp = arguments[0], maxItems = arguments[1], maxMs = arguments[2];
+const stepPx = arguments[3], idleMs = arguments[4], pauseMs = arguments[5];
+const sel = arguments[6];
+const done = arguments[arguments.length - 1];
+const ctx = __igScrollCtx(xp);
+if (!ctx) { done(null); return; }
+const dlg = ctx.dlg;
+
+const seen = new Set();
+const out = [];
+const take = (a) => {
+    // href = "/<username>/" garantizado por el selector
+    const u = (a.getAttribute('href').split('/')[1] || '').toLowerCase();
+    if (u && u.length <= 30 && !seen.has(u)) { seen.add(u); out.push(u); }
+};
+const harvest = (root) => {
+    if (root.matches && root.matches(sel)) take(root);
+    if (root.querySelectorAll) for (const a of root.querySelectorAll(sel)) take(a);
+};
+
+const t0 = Date.now();
+let lastGrowth = t0, finished = false, timer = null;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    obs.disconnect();
+    clearTimeout(timer);
+    done(out.slice(0, maxItems));
+};
+const obs = new MutationObserver((muts) => {
+    const before = out.length;
+    for (const m of muts) for (const n of m.addedNodes) if (n.nodeType === 1) harvest(n);
+    if (out.length > before) lastGrowth = Date.now();
+    if (out.length >= maxItems) finish();
+});
+obs.observe(dlg, {childList: true, subtree: true});
+harvest(dlg);
+
+const tick = () => {
+    if (finished) return;
+    const now = Date.now();
+    if (out.length >= maxItems || now - t0 >= maxMs || now - lastGrowth >= idleMs) { finish(); return; }
+    const step = (maxItems - out.length) < 20 ? Math.min(145, stepPx) : stepPx;
+    const target = (__igScrollCtx(xp) || ctx).target;
+    target.scrollTop = Math.min(target.scrollTop + step, target.scrollHeight);
+    timer = setTimeout(tick, pauseMs * (0.6 + Math.random() * 0.8));
+};
+timer = setTimeout(tick, pauseMs);
+"""
+
+_DRIVER_DEAD_MARKERS = (
+    "invalid session id",
+    "not connected to devtools",
+    "session deleted as the browser has closed the connection",
+)
 
 
 class SeleniumBrowserAdapter(BrowserPort):
@@ -62,6 +147,8 @@ class SeleniumBrowserAdapter(BrowserPort):
         small_pause: float = 0.30,
         small_jitter: float = 0.30,
         max_scrolls_without_growth: int = 5,
+        batch_scroll: bool = True,
+        batch_scroll_max_ms: int = 20000,
         **_: object,
     ) -> None:
         self.driver = driver
@@ -76,6 +163,9 @@ class SeleniumBrowserAdapter(BrowserPort):
         self._small_jitter = float(small_jitter)
         self._max_scrolls_no_growth = int(max_scrolls_without_growth)
         self._scroll_step = 145 
+        # Con read_usernames_js propio se respeta el loop clásico (el script async no lo usa)
+        self._batch_scroll = bool(batch_scroll) and read_usernames_js is None
+        self._batch_scroll_max_ms = int(batch_scroll_max_ms)
 
         self._open_profile: Callable[[str], None] = self.__open_profile_default
         self._open_following_modal: Callable[[], None] = self.__open_following_modal_default
@@ -90,11 +180,22 @@ class SeleniumBrowserAdapter(BrowserPort):
             logger.debug("[browser] GET %s", url)
             self._sched.wait_turn()
             self.driver.get(url)
+            wait_dom_interactive(self.driver, url_contains=f"/{username.strip().lstrip('@')}", timeout=self._wait_timeout)
+            # En vez de pausas fijas: esperar al header del perfil o al popup de login
+            # (lo que aparezca primero) y recién ahí mirar el popup con timeout corto
             try:
-                profile_page.close_instagram_login_popup(self.driver, timeout=5, scheduler=self._sched)
+                WebDriverWait(self.driver, 6).until(
+                    EC.any_of(
+                        EC.presence_of_element_located((By.TAG_NAME, "header")),
+                        EC.presence_of_element_located((By.XPATH, FOLLOWING_DIALOG_XPATH)),
+                    )
+                )
+            except TimeoutException:
+                logger.debug("[browser] profile header not found for %s", username)
+            try:
+                profile_page.close_instagram_login_popup(self.driver, timeout=1, scheduler=self._sched)
             except Exception:
                 pass
-            sleep_jitter(1.0, 0.35)
         except (TimeoutException, WebDriverException) as e:
             raise BrowserNavigationError(f"navigation to profile failed: {e}") from e
 
@@ -108,6 +209,7 @@ class SeleniumBrowserAdapter(BrowserPort):
         try:
             self.driver.get(reels_url)
             WebDriverWait(self.driver, self._wait_timeout).until(EC.url_contains("/reels"))
+            wait_dom_interactive(self.driver, url_contains="/reels", timeout=self._wait_timeout)
         except Exception:
             try:
                 tab = WebDriverWait(self.driver, self._wait_timeout).until(
@@ -151,7 +253,17 @@ class SeleniumBrowserAdapter(BrowserPort):
 
             self._open_following_modal()
 
-            unique: List[str] = []
+            if self._batch_scroll:
+                batch = self._collect_followings_batch(max_followings)
+                if batch is not None:
+                    duration = time.time() - start
+                    browser_action_duration_seconds.labels(action="get_followings", account=account).observe(duration)
+                    return batch
+
+            # Buffer preasignado al tope pedido: se llena por índice y no crece
+            limit = max(0, int(max_followings))
+            unique: List[Optional[str]] = [None] * limit
+            n = 0
             seen: Set[str] = set()
             no_growth = 0
             scrolls_done = 0
@@ -159,7 +271,7 @@ class SeleniumBrowserAdapter(BrowserPort):
 
             self._sleep_human()
 
-            while len(unique) < max_followings:
+            while n < limit:
                 try:
                     batch = self._read_visible_usernames()
                 except RetryError as e:
@@ -168,11 +280,7 @@ class SeleniumBrowserAdapter(BrowserPort):
                     # worker lo marque como retryable y el router reencole.
                     last = getattr(e, "last_error", None) or getattr(e, "__cause__", None)
                     msg = (str(last) if last else "").lower()
-                    if (
-                        "invalid session id" in msg
-                        or "not connected to devtools" in msg
-                        or "session deleted as the browser has closed the connection" in msg
-                    ):
+                    if any(m in msg for m in _DRIVER_DEAD_MARKERS):
                         raise BrowserDOMError(f"driver dead: {last}") from e
                     raise BrowserDOMError("usernames list stale") from e
                 except WebDriverException as e:
@@ -181,29 +289,31 @@ class SeleniumBrowserAdapter(BrowserPort):
                         raise BrowserRateLimitError("temporarily blocked by Instagram") from e
                     raise BrowserDOMError(str(e)) from e
 
-                before = len(unique)
+                before = n
                 for s in batch:
                     if s in seen:
                         continue
-                    unique.append(s)
-                    seen.add(s)
-                    if len(unique) >= max_followings:
+                    unique[n] = s
+                    n += 1
+                    if n >= limit:
                         break
+                    seen.add(s)
 
-                if len(unique) >= max_followings:
+                if n >= limit:
                     break
 
-                if len(unique) == before:
+                if n == before:
                     no_growth += 1
                     if no_growth >= self._max_scrolls_no_growth:
                         break
                 else:
                     no_growth = 0
-                    last_gain = len(unique) - before
+                    last_gain = n - before
 
-                remaining = max(0, max_followings - len(unique))
+                remaining = limit - n
                 self._scroll_step = 145 if remaining < 20 else 400
 
+                # Única pausa por paso: cubre el render de las filas nuevas antes de la próxima lectura
                 try:
                     self._scroll_following_modal_once()
                 finally:
@@ -211,14 +321,13 @@ class SeleniumBrowserAdapter(BrowserPort):
                     scrolls_done += 1
 
                 avg_gain = last_gain if last_gain > 0 else 10
-                import math
                 max_reasonable_scrolls = math.ceil(remaining / max(1, avg_gain))
                 if scrolls_done >= max_reasonable_scrolls and remaining > 0:
                     break
 
             duration = time.time() - start
             browser_action_duration_seconds.labels(action="get_followings", account=account).observe(duration)
-            return unique
+            return unique[:n] if n < limit else unique
         except Exception:
             duration = time.time() - start
             browser_action_duration_seconds.labels(action="get_followings", account=account).observe(duration)
@@ -316,24 +425,62 @@ class SeleniumBrowserAdapter(BrowserPort):
     # ---------------------------------------------------------- Followings helper
 
     def _default_read_usernames_js(self) -> str:
-        return r"""
-        const dlg = document.evaluate("//div[@role='dialog']", document, null,
-            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
-        if (!dlg) return [];
-        const anchors = dlg.querySelectorAll("a[href*='instagram.com/'], a[href^='/']");
-        const users = [];
-        for (const a of anchors) {
-            let href = (a.getAttribute('href') || '').split('?')[0].split('#')[0];
-            if (!href) continue;
-            if (href.startsWith('/')) href = 'https://www.instagram.com' + href;
-            try {
-            const u = new URL(href).pathname.split('/').filter(Boolean)[0] || '';
-            if (u && u.length <= 30 && !u.includes(' ')) users.push(u.toLowerCase());
-            } catch {}
+        return _SCROLL_CTX_JS + r"""
+        const ctx = __igScrollCtx(arguments[0]);
+        if (!ctx) return [];
+        const dlg = ctx.dlg;
+        const users = new Set();
+        for (const a of dlg.querySelectorAll(arguments[1])) {
+            const u = a.getAttribute('href').split('/')[1] || '';
+            if (u && u.length <= 30) users.add(u.toLowerCase());
         }
-        return [...new Set(users)];
+        return [...users];
         """
 
+    def _collect_followings_batch(self, max_followings: int) -> Optional[List[str]]:
+        """
+        Scrollea el modal y junta usernames en un único execute_async_script.
+        Devuelve None si el script no pudo correr, para caer al loop clásico.
+        """
+        # El script debe resolver antes del script timeout del driver
+        pause_ms = max(50, int(self._small_pause * 1000))
+        idle_ms = max(1500, self._max_scrolls_no_growth * 800)
+        try:
+            result = self.driver.execute_async_script(
+                _COLLECT_FOLLOWINGS_ASYNC_JS,
+                FOLLOWING_DIALOG_XPATH,
+                int(max_followings),
+                self._batch_scroll_max_ms,
+                400,
+                idle_ms,
+                pause_ms,
+                FOLLOWING_ROW_LINK_CSS,
+            )
+        except WebDriverException as e:
+            msg = (str(e) or "").lower()
+            if any(m in msg for m in _DRIVER_DEAD_MARKERS):
+                raise BrowserDOMError(f"driver dead: {e}") from e
+            if "temporarily blocked" in msg or "try again later" in msg:
+                raise BrowserRateLimitError("temporarily blocked by Instagram") from e
+            logger.debug("[browser] batch scroll failed, fallback to loop: %s", e)
+            return None
+
+        if not isinstance(result, list):
+            return None
+        return self._normalize_usernames(result)[:max_followings]
+
+    @staticmethod
+    def _normalize_usernames(result: Sequence[object]) -> List[str]:
+        seen: Set[str] = set()
+        uniq: List[str] = []
+        for x in result:
+            if isinstance(x, str):
+                s = x.strip().lstrip("@").lower()
+                if s and "/" not in s and " " not in s and s not in seen:
+                    seen.add(s)
+                    uniq.append(s)
+        return uniq
+
     @retry((WebDriverException,))
     def _read_visible_usernames(self) -> List[str]:
         WebDriverWait(self.driver, self._wait_timeout).until(
@@ -347,10 +494,10 @@ class SeleniumBrowserAdapter(BrowserPort):
         except TimeoutException:
             logger.warning("No se encontraron links en el modal después de esperar")
 
-        sleep_jitter(0.5, 0.3)
-
         try:
-            result = self.driver.execute_script(self._read_usernames_js)
+            result = self.driver.execute_script(
+                self._read_usernames_js, FOLLOWING_DIALOG_XPATH, FOLLOWING_ROW_LINK_CSS
+            )
         except WebDriverException:
             raise
         except Exception as e:
@@ -359,19 +506,7 @@ class SeleniumBrowserAdapter(BrowserPort):
         if not isinstance(result, list):
             raise WebDriverException("script did not return a list")
 
-        out: List[str] = []
-        for x in result:
-            if isinstance(x, str):
-                s = x.strip().lstrip("@").lower()
-                if s and "/" not in s and " " not in s:
-                    out.append(s)
-        seen: Set[str] = set()
-        uniq: List[str] = []
-        for u in out:
-            if u not in seen:
-                seen.add(u)
-                uniq.append(u)
-        return uniq
+        return self._normalize_usernames(result)
 
     # ----------------------- default hooks -----------------------
 
@@ -400,6 +535,10 @@ class SeleniumBrowserAdapter(BrowserPort):
             WebDriverWait(self.driver, self._wait_timeout).until(
                 EC.presence_of_element_located((By.XPATH, FOLLOWING_DIALOG_XPATH))
             )
+            try:
+                self.driver.execute_script("window.__ig_scroll_ctx = null;")
+            except WebDriverException:
+                pass
             sleep_jitter(0.45, 0.35)
         except TimeoutException as e:
             raise BrowserDOMError(f"opening following modal timed out: {e}") from e
@@ -409,18 +548,12 @@ class SeleniumBrowserAdapter(BrowserPort):
     def __scroll_following_modal_once_default(self) -> None:
         try:
             self.driver.execute_script(
-                """
-                const xp = arguments[0];
-                const step = arguments[1];
-                const dlg = document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
-                if (!dlg) return;
-                let target = null;
-                const nodes = dlg.querySelectorAll('div');
-                for (const n of nodes) {
-                  if (n.scrollHeight > n.clientHeight + 8) { target = n; break; }
-                }
-                if (!target) target = dlg;
-                target.scrollTop = Math.min(target.scrollTop + step, target.scrollHeight);
+                _SCROLL_CTX_JS
+                + """
+                const ctx = __igScrollCtx(arguments[0]);
+                if (!ctx) return;
+                const target = ctx.target;
+                target.scrollTop = Math.min(target.scrollTop + arguments[1], target.scrollHeight);
                 """,
                 FOLLOWING_DIALOG_XPATH,
                 int(self._scroll_step) if hasattr(self, "_scroll_step") else 145,
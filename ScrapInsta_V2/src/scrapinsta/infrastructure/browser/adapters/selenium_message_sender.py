@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from urllib.parse import urlsplit
 from typing import Optional
 
 from selenium.common.exceptions import (
@@ -25,6 +26,7 @@ from scrapinsta.domain.ports.message_port import (
 )
 from scrapinsta.application.dto.messages import MessageRequest
 
+from scrapinsta.infrastructure.browser.core.browser_utils import wait_dom_interactive
 from scrapinsta.infrastructure.browser.pages import profile_page
 
 logger = logging.getLogger(__name__)
@@ -204,6 +206,9 @@ class SeleniumMessageSender(MessageSenderPort):
             self.driver.get(url)
         except (TimeoutException, WebDriverException) as e:
             raise DMInputTimeout(f"navigation failed: {e}") from e
+        # Con pageLoadStrategy "none" get() vuelve antes de que cambie el documento:
+        # sin esta espera el botón 'Message' podría ser el del perfil anterior
+        wait_dom_interactive(self.driver, url_contains=urlsplit(url).path, timeout=self._wait_timeout)
 
     def _wait_any_xpath(self, xpaths: tuple[str, ...], *, timeout: Optional[float] = None):
         _timeout = timeout or self._wait_timeout
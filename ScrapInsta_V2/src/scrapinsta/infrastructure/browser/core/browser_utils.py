@@ -3,7 +3,8 @@ from __future__ import annotations
 import re
 import shutil
 import subprocess
-from typing import Optional, Tuple
+import urllib.request
+from typing import Dict, Optional, Sequence, Tuple
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -12,6 +13,9 @@ from scrapinsta.crosscutting.logging_config import get_logger
 
 log = get_logger("browser_utils")
 
+# host:port del proxy -> IP de salida observada (None si el probe falló); vive todo el proceso
+_PROXY_PROBE_CACHE: Dict[str, Optional[str]] = {}
+
 
 # ------------------------------ helpers genéricos ------------------------------
 
@@ -40,6 +44,7 @@ def quick_probe(driver, *, timeout: int = 6) -> None:
     """Intento best-effort de warm-up/red de salida, sin levantar excepciones."""
     try:
         driver.get("https://api.ipify.org?format=json")
+        wait_dom_interactive(driver, url_contains="ipify", timeout=timeout)
         WebDriverWait(driver, timeout).until(lambda d: d.find_element(By.TAG_NAME, "body"))
         body = driver.find_element(By.TAG_NAME, "body").text
         log.info("ipify_response", body=(body[:180].replace("\n", " ")))
@@ -48,12 +53,127 @@ def quick_probe(driver, *, timeout: int = 6) -> None:
 
     try:
         driver.get("https://httpbin.org/headers")
+        wait_dom_interactive(driver, url_contains="httpbin", timeout=timeout)
         WebDriverWait(driver, timeout).until(lambda d: d.find_element(By.TAG_NAME, "body"))
         log.debug("httpbin_headers_ok")
     except Exception:
         pass
 
 
+def wait_dom_interactive(driver, *, url_contains: str = "", timeout: float = 10.0) -> bool:
+    """
+    Espera a que el documento navegado tenga DOM (readyState != 'loading').
+    Con pageLoadStrategy 'none' driver.get vuelve apenas arranca la navegación;
+    `url_contains` evita dar por bueno el documento anterior. Nunca levanta.
+    """
+    def _ready(d) -> bool:
+        if url_contains and url_contains not in (d.current_url or ""):
+            return False
+        return d.execute_script("return document.readyState") != "loading"
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(_ready)
+        return True
+    except Exception as e:
+        log.debug("dom_interactive_wait_failed", url_contains=url_contains, error=str(e))
+        return False
+
+
+# Resuelve en cuanto alguna XPath existe (MutationObserver) o vence el plazo:
+# un solo round-trip en vez de un find_element por XPath cada 0.5s
+_JS_WAIT_ANY_XPATH = r"""
+const xps = arguments[0], ms = arguments[1], done = arguments[arguments.length - 1];
+const find = () => {
+    for (let i = 0; i < xps.length; i++) {
+        if (document.evaluate(xps[i], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue) return i;
+    }
+    return -1;
+};
+const first = find();
+if (first >= 0) { done(first); return; }
+let finished = false, timer = null;
+const obs = new MutationObserver(() => { const i = find(); if (i >= 0) finish(i); });
+const finish = (v) => {
+    if (finished) return;
+    finished = true;
+    obs.disconnect();
+    clearTimeout(timer);
+    done(v);
+};
+obs.observe(document.documentElement || document, {childList: true, subtree: true});
+timer = setTimeout(() => finish(-1), ms);
+"""
+
+
+def wait_for_any_xpath(driver, xpaths: Sequence[str], *, timeout: float = 10.0) -> Optional[int]:
+    """
+    Espera dentro del navegador a que aparezca alguna de `xpaths`.
+    Devuelve el índice de la primera que matchea, -1 si vence `timeout`, o None
+    si el script no pudo correr (p.ej. el documento se descargó a mitad de la
+    espera); en ese caso el caller debe caer a su WebDriverWait. Nunca levanta.
+    """
+    try:
+        idx = driver.execute_async_script(_JS_WAIT_ANY_XPATH, list(xpaths), int(timeout * 1000))
+        return int(idx)
+    except Exception as e:
+        log.debug("wait_for_any_xpath_failed", error=str(e))
+        return None
+
+
+def widen_command_pool(driver, *, maxsize: int) -> None:
+    """
+    Agranda el pool urllib3 del command executor (driver -> chromedriver).
+
+    Selenium crea un PoolManager con maxsize=1: comandos concurrentes (p.ej. el
+    monitoreo de popups) abren conexiones nuevas y urllib3 descarta las sobrantes
+    ("connection pool is full"). Chrome local no acepta ClientConfig en el
+    constructor, así que se reconstruye el pool tras crear el driver (best-effort).
+    """
+    try:
+        executor = driver.command_executor
+        config = executor._client_config
+        if not config.keep_alive:
+            return
+        config.init_args_for_pool_manager = {"init_args_for_pool_manager": {"maxsize": int(maxsize)}}
+        old_conn = getattr(executor, "_conn", None)
+        executor._conn = executor._get_connection_manager()
+        if old_conn is not None:
+            old_conn.clear()
+    except Exception as e:
+        log.debug("command_pool_widen_failed", error=str(e))
+
+
+def probe_proxy_egress(proxy_str: str, *, timeout: float = 5.0) -> Optional[str]:
+    """
+    Verifica la salida por el proxy con un único GET HTTP (sin navegar el driver) y
+    cachea el resultado por host:port para el resto del proceso. Best-effort: no lanza.
+    """
+    try:
+        p_user, p_pass, p_host, p_port = parse_proxy(proxy_str)
+    except ValueError as e:
+        log.debug("proxy_probe_invalid_proxy", error=str(e))
+        return None
+
+    key = f"{p_host}:{p_port}"
+    if key in _PROXY_PROBE_CACHE:
+        return _PROXY_PROBE_CACHE[key]
+
+    proxy_url = f"http://{p_user}:{p_pass}@{p_host}:{p_port}"
+    opener = urllib.request.build_opener(
+        urllib.request.ProxyHandler({"http": proxy_url, "https": proxy_url})
+    )
+    body: Optional[str] = None
+    try:
+        with opener.open("https://api.ipify.org?format=json", timeout=timeout) as resp:
+            body = resp.read(256).decode("utf-8", "replace")
+        log.info("ipify_response", proxy=key, body=body[:180].replace("\n", " "))
+    except Exception as e:
+        log.debug("proxy_probe_failed", proxy=key, error=str(e))
+
+    _PROXY_PROBE_CACHE[key] = body
+    return body
+
+
 def safe_quit(driver) -> None:
     """Cierra el driver si está vivo (idempotente)."""
     if driver:
@@ -39,7 +39,17 @@ def build_chrome_options(
         "--metrics-recording-only",
         "--no-first-run",
         "--no-default-browser-check",
-        "--disable-features=TranslateUI,AutomationControlled",
+        "--disable-sync",
+        "--disable-breakpad",
+        "--disable-component-update",
+        "--disable-client-side-phishing-detection",
+        "--disable-default-apps",
+        "--disable-hang-monitor",
+        "--disable-prompt-on-repost",
+        "--mute-audio",
+        # Chrome sólo respeta el último --disable-features: van todas juntas
+        "--disable-features=TranslateUI,Translate,AutomationControlled,MediaRouter,"
+        "OptimizationHints,InterestFeedContentSuggestions,CalculateNativeWinOcclusion",
         "--ignore-certificate-errors",
         f"--window-size={default_window_size}",
     ]
@@ -88,16 +98,24 @@ def build_chrome_options(
                 "no_proxy": "localhost,127.0.0.1",
             },
             "disable_capture": True,
-            "mitm_http2": False,
+            # Reusar sockets hacia el proxy upstream en vez de abrir uno por request
+            "connection_keep_alive": True,
+            # HTTP/2 en el mitm sólo si el upstream lo soporta (opt-in por env)
+            "mitm_http2": os.getenv("SELENIUMWIRE_HTTP2", "false").lower() in ("1", "true", "yes"),
             "verify_ssl": True,
             "connection_timeout": 15,
             "suppress_connection_errors": True,
         }
         logger.info("Proxy configurado: %s:%s (user=***, pass=***)", p_host, p_port)
 
-    # pageLoadStrategy "eager" (best-effort)
+    # pageLoadStrategy "none" por defecto: driver.get no espera DOMContentLoaded, así
+    # que cada navegación debe llamar a wait_dom_interactive (browser_utils) antes de
+    # leer el DOM o las cookies (PAGE_LOAD_STRATEGY=eager revierte)
+    strategy = os.getenv("PAGE_LOAD_STRATEGY", "none").strip().lower()
+    if strategy not in ("none", "eager", "normal"):
+        strategy = "none"
     try:
-        opts.set_capability("pageLoadStrategy", "eager")
+        opts.set_capability("pageLoadStrategy", strategy)
     except Exception:
         logger.debug("No se pudo setear pageLoadStrategy", exc_info=True)
 
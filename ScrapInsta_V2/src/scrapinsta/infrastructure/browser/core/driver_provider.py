@@ -13,7 +13,13 @@ from seleniumwire.undetected_chromedriver.v2 import Chrome as ChromeWire
 from scrapinsta.config.settings import Settings
 from scrapinsta.crosscutting.logging_config import get_logger
 
-from .browser_utils import detect_chrome_major, quick_probe, safe_quit, safe_username
+from .browser_utils import (
+    detect_chrome_major,
+    probe_proxy_egress,
+    safe_quit,
+    safe_username,
+    widen_command_pool,
+)
 from .driver_factory import build_chrome_options
 
 log = get_logger("driver_provider")
@@ -43,6 +49,7 @@ class DriverProvider:
         extra_flags: Optional[list[str]] = None,
         retry_attempts: int = 3,
         retry_initial_delay: float = 4.0,
+        command_pool_maxsize: int = 20,
         settings: Optional[Settings] = None,
     ) -> None:
         username = (account_username or "").strip()
@@ -72,6 +79,7 @@ class DriverProvider:
         self.extra_flags = extra_flags or []
         self.retry_attempts = max(1, int(retry_attempts))
         self.retry_initial_delay = max(0.1, float(retry_initial_delay))
+        self.command_pool_maxsize = max(1, int(command_pool_maxsize))
         self.settings = settings or Settings()
 
         self.driver = None
@@ -84,6 +92,44 @@ class DriverProvider:
     def _select_user_agent(self) -> Optional[str]:
         return self.user_agent
 
+    def _apply_stealth(self, driver) -> None:
+        """
+        Aplica selenium-stealth al driver recién creado.
+        Los ~13 Page.addScriptToEvaluateOnNewDocument que emite stealth() se
+        juntan en un único script (un round-trip CDP); el resto de comandos pasa directo.
+        """
+        scripts: list[str] = []
+        had_own_attr = "execute_cdp_cmd" in vars(driver)
+        original = driver.execute_cdp_cmd
+
+        def _buffered(cmd: str, cmd_args: dict):
+            if cmd == "Page.addScriptToEvaluateOnNewDocument":
+                scripts.append(cmd_args["source"])
+                return {}
+            return original(cmd, cmd_args)
+
+        driver.execute_cdp_cmd = _buffered
+        try:
+            stealth(
+                driver,
+                languages=["es-AR", "es"],
+                vendor="Google Inc.",
+                platform="Win32",
+                webgl_vendor="Intel Inc.",
+                renderer="Intel Iris OpenGL Engine",
+                fix_hairline=True,
+            )
+        finally:
+            if had_own_attr:
+                driver.execute_cdp_cmd = original
+            else:
+                del driver.execute_cdp_cmd
+
+        if scripts:
+            # Cada evasión aislada: si una falla, las siguientes igual se aplican
+            source = "\n".join(f"try {{\n{js}\n}} catch (e) {{}}" for js in scripts)
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+
     # ------------------------------------------------------------------ public
 
     def initialize_driver(self):
@@ -122,22 +168,19 @@ class DriverProvider:
                 driver.set_script_timeout(self.script_timeout)
                 driver.implicitly_wait(0)
 
+                # Reutiliza conexiones keep-alive a chromedriver entre comandos
+                widen_command_pool(driver, maxsize=self.command_pool_maxsize)
+
                 # Stealth (best-effort)
                 try:
-                    stealth(
-                        driver,
-                        languages=["es-AR", "es"],
-                        vendor="Google Inc.",
-                        platform="Win32",
-                        webgl_vendor="Intel Inc.",
-                        renderer="Intel Iris OpenGL Engine",
-                        fix_hairline=True,
-                    )
+                    self._apply_stealth(driver)
                 except Exception:
                     log.debug("selenium_stealth_apply_failed", account=self.username)
 
-                # Warm-up opcional (best-effort)
-                quick_probe(driver)
+                # Chequeo de salida por proxy: un GET HTTP cacheado por proxy,
+                # sin navegar el driver (best-effort)
+                if self.proxy_str:
+                    probe_proxy_egress(self.proxy_str)
 
                 self.driver = driver
                 log.info("driver_initialized", account=self.username, mode="uc_local")
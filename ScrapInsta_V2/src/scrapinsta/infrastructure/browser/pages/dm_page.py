@@ -10,6 +10,7 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from scrapinsta.crosscutting.human.tempo import sleep_jitter
+from scrapinsta.infrastructure.browser.core.browser_utils import wait_dom_interactive
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +32,12 @@ _BTN_SEND_XPATHS = (
 
 
 def open_profile(driver: WebDriver, username: str, base_url: str = "https://www.instagram.com") -> None:
-    """Abre el perfil (sin reintentos; sin cerrar popups)."""
-    url = f"{base_url.rstrip('/')}/{username.strip().lstrip('@')}/"
+    """Abre el perfil (sin reintentos; sin cerrar popups) y espera su documento."""
+    uname = username.strip().lstrip('@')
+    url = f"{base_url.rstrip('/')}/{uname}/"
     logger.debug("[dm_page] GET %s", url)
     driver.get(url)
+    wait_dom_interactive(driver, url_contains=f"/{uname}/")
 
 
 def open_message_dialog(driver: WebDriver, timeout: float = 10.0) -> None:
@@ -85,18 +85,42 @@ def close_instagram_login_popup(
         return False
 
 
+_BIO_XPATHS = (
+    "//div[@role='button']//span[@dir='auto']",  # Más común primero
+    "//header//h1/following-sibling::div//span[@dir='auto']",
+    "//section//ul/ancestor::section/preceding::div[1]//span[@dir='auto']",
+)
+
+# Prueba los mismos selectores que el fallback, en orden, en un solo round-trip
+_JS_BIO = r"""
+for (const xp of arguments[0]) {
+    const el = document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const t = el ? (el.innerText || '').trim() : '';
+    if (t) return t;
+}
+return '';
+"""
+
+
 def extract_biography(driver: WebDriver) -> str:
     """
     Bio del perfil. Usa varios selectores por si cambia el DOM.
     OPTIMIZADO: Ordenado por probabilidad de éxito (más común primero).
+    Primero lee los selectores en una sola llamada JS; si no hay texto
+    (DOM aún sin renderizar) cae a la espera por selector.
     """
     try:
-        # Orden optimizado: primero el más común (role='button'), luego los alternativos
-        text = _find_first_text(driver, [
-            (By.XPATH, "//div[@role='button']//span[@dir='auto']"),  # Más común primero
-            (By.XPATH, "//header//h1/following-sibling::div//span[@dir='auto']"),
-            (By.XPATH, "//section//ul/ancestor::section/preceding::div[1]//span[@dir='auto']"),
-        ], timeout=0.8)  # Timeout base reducido de 1.0 a 0.8
+        text = driver.execute_script(_JS_BIO, list(_BIO_XPATHS))
+        if text:
+            return str(text)
+    except Exception as e:
+        logger.debug("extract_biography: JS falló, uso selectores: %s", e)
+    try:
+        text = _find_first_text(
+            driver,
+            [(By.XPATH, xp) for xp in _BIO_XPATHS],
+            timeout=0.8,
+        )  # Timeout base reducido de 1.0 a 0.8
         if not text:
             logger.debug("Bio no encontrada")
             return ""
@@ -118,53 +142,111 @@ def _stat_number_from(elem) -> int:
     return num
 
 
+_FOLLOWERS_XPATH = ".//a[contains(@href,'/followers')]/span"
+_FOLLOWING_XPATH = ".//a[contains(@href,'/following')]/span"
+_POSTS_XPATH = (
+    ".//span[contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜ','abcdefghijklmnopqrstuvwxyzáéíóúü'),'posts') "
+    "or contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜ','abcdefghijklmnopqrstuvwxyzáéíóúü'),'publicaciones')]"
+)
+
+# Los tres contadores crudos (prefiere @title, igual que _stat_number_from) en un
+# solo round-trip. null por contador no visible; null total si no hay <header>.
+_JS_BASIC_STATS = r"""
+const h = document.querySelector('header');
+if (!h) return null;
+const one = (xp, ctx) => document.evaluate(xp, ctx, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const shown = el => !!el && el.getClientRects().length > 0;
+const raw = el => {
+    const t = one(".//span[@title]", el);
+    return t ? (t.getAttribute('title') || '') : (el.innerText || '');
+};
+const out = {followers: null, following: null, posts: null};
+const fo = one(arguments[0], h);
+if (shown(fo)) out.followers = raw(fo);
+const fi = one(arguments[1], h);
+if (shown(fi)) out.following = raw(fi);
+const p = one(arguments[2], h);
+if (shown(p)) {
+    const n = one(".//span[normalize-space()]", p);
+    out.posts = n ? raw(n) : (p.innerText || '');
+}
+return out;
+"""
+
+
+def _basic_stats_from_js(driver: WebDriver) -> Optional[Dict[str, int]]:
+    """Stats vía _JS_BASIC_STATS; None si el script falla o no hay header."""
+    try:
+        raw = driver.execute_script(_JS_BASIC_STATS, _FOLLOWERS_XPATH, _FOLLOWING_XPATH, _POSTS_XPATH)
+    except Exception as e:
+        logger.debug("extract_basic_stats: JS falló, uso elementos: %s", e)
+        return None
+    if not isinstance(raw, dict):
+        return None
+    stats = {"posts": 0, "followers": 0, "following": 0}
+    for key in stats:
+        value = raw.get(key)
+        if value is None:
+            logger.info("   ↳ no se encontró bloque %s", key)
+            continue
+        stats[key] = parse_number(extract_number(str(value)))
+        logger.info("[%s] %s (%s)", key, stats[key], value)
+    return stats
+
+
+def _basic_stats_from_elements(header) -> Dict[str, int]:
+    """Camino previo por elementos (varios round-trips por contador)."""
+    stats = {"posts": 0, "followers": 0, "following": 0}
+
+    # --- Followers ---
+    try:
+        el = header.find_element(By.XPATH, _FOLLOWERS_XPATH)
+        if el.is_displayed():
+            stats["followers"] = _stat_number_from(el)
+            logger.info("[followers] %s", stats["followers"])
+    except NoSuchElementException:
+        logger.info("   ↳ no se encontró bloque /followers")
+
+    # --- Following ---
+    try:
+        el = header.find_element(By.XPATH, _FOLLOWING_XPATH)
+        if el.is_displayed():
+            stats["following"] = _stat_number_from(el)
+            logger.info("[following] %s", stats["following"])
+    except NoSuchElementException:
+        logger.info("   ↳ no se encontró bloque /following")
+
+    # --- Posts ---
+    try:
+        posts_el = header.find_element(By.XPATH, _POSTS_XPATH)
+        if posts_el.is_displayed():
+            try:
+                num_el = posts_el.find_element(By.XPATH, ".//span[normalize-space()]")
+                stats["posts"] = _stat_number_from(num_el)
+            except NoSuchElementException:
+                stats["posts"] = parse_number(extract_number(posts_el.text or ""))
+            logger.info("[posts] %s", stats["posts"])
+    except NoSuchElementException:
+        logger.info("   ↳ no se encontró bloque de publicaciones")
+
+    return stats
+
+
 def extract_basic_stats(driver: WebDriver, timeout: int = 5):
     """
     Extrae posts, followers y following desde el <header>.
     - Usa anchors /followers y /following si existen (más confiables).
     - Busca bloque de posts por texto ('posts' o 'publicaciones').
     - Usa parse_number(extract_number(...)).
+    - Lee los tres contadores con un solo execute_script; si falla, recorre elementos.
     """
     try:
         header = WebDriverWait(driver, timeout).until(
             EC.presence_of_element_located((By.XPATH, "//header"))
         )
-        stats = {"posts": 0, "followers": 0, "following": 0}
-
-        # --- Followers ---
-        try:
-            el = header.find_element(By.XPATH, ".//a[contains(@href,'/followers')]/span")
-            if el.is_displayed():
-                stats["followers"] = _stat_number_from(el)
-                logger.info("[followers] %s", stats["followers"])
-        except NoSuchElementException:
-            logger.info("   ↳ no se encontró bloque /followers")
-
-        # --- Following ---
-        try:
-            el = header.find_element(By.XPATH, ".//a[contains(@href,'/following')]/span")
-            if el.is_displayed():
-                stats["following"] = _stat_number_from(el)
-                logger.info("[following] %s", stats["following"])
-        except NoSuchElementException:
-            logger.info("   ↳ no se encontró bloque /following")
-
-        # --- Posts ---
-        try:
-            posts_el = header.find_element(
-                By.XPATH,
-                ".//span[contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜ','abcdefghijklmnopqrstuvwxyzáéíóúü'),'posts') "
-                "or contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜ','abcdefghijklmnopqrstuvwxyzáéíóúü'),'publicaciones')]"
-            )
-            if posts_el.is_displayed():
-                try:
-                    num_el = posts_el.find_element(By.XPATH, ".//span[normalize-space()]")
-                    stats["posts"] = _stat_number_from(num_el)
-                except NoSuchElementException:
-                    stats["posts"] = parse_number(extract_number(posts_el.text or ""))
-                logger.info("[posts] %s", stats["posts"])
-        except NoSuchElementException:
-            logger.info("   ↳ no se encontró bloque de publicaciones")
+        stats = _basic_stats_from_js(driver)
+        if stats is None:
+            stats = _basic_stats_from_elements(header)
 
         # --- Verificación final ---
         if all(v == 0 for v in stats.values()):
@@ -180,22 +262,35 @@ def extract_basic_stats(driver: WebDriver, timeout: int = 5):
         return None
 
 
+_PRIVATE_MARKERS = ("esta cuenta es privada", "síguela para ver", "this account is private")
+
+# Filtrado en el navegador: un solo round-trip en vez de un .text por span
+_JS_IS_PRIVATE = (
+    "const marks=arguments[0];"
+    "return Array.from(document.querySelectorAll(\"span[dir='auto']\")).some(s=>{"
+    "const t=(s.textContent||'').toLowerCase(); return marks.some(m=>t.includes(m));});"
+)
+
+_JS_IS_VERIFIED = (
+    "return document.querySelector(\"svg[aria-label='Verificado'], svg[aria-label='Verified']\") !== null;"
+)
+
+
+# Ambas banderas del perfil en un solo round-trip (para el snapshot)
+_JS_PROFILE_FLAGS = (
+    "const marks=arguments[0];"
+    "const priv=Array.from(document.querySelectorAll(\"span[dir='auto']\")).some(s=>{"
+    "const t=(s.textContent||'').toLowerCase(); return marks.some(m=>t.includes(m));});"
+    "const ver=document.querySelector(\"svg[aria-label='Verificado'], svg[aria-label='Verified']\") !== null;"
+    "return [priv, ver];"
+)
+
 def is_profile_private(driver: WebDriver) -> bool:
     """
     Detecta si el perfil es privado escaneando textos típicos.
     """
     try:
-        spans = driver.find_elements(By.CSS_SELECTOR, "span[dir='auto']")
-        for s in spans:
-            try:
-                t = (s.text or "").lower()
-                if "esta cuenta es privada" in t or "síguela para ver" in t or "this account is private" in t:
-                    return True
-            except StaleElementReferenceException:
-                continue
-            except Exception:
-                continue
-        return False
+        return bool(driver.execute_script(_JS_IS_PRIVATE, list(_PRIVATE_MARKERS)))
     except Exception:
         return False
 
@@ -205,14 +300,25 @@ def is_profile_verified(driver: WebDriver) -> bool:
     Busca el badge de verificación accesible por aria-label.
     """
     try:
-        driver.find_element(By.CSS_SELECTOR, "svg[aria-label='Verificado'], svg[aria-label='Verified']")
-        return True
-    except NoSuchElementException:
-        return False
+        return bool(driver.execute_script(_JS_IS_VERIFIED))
     except Exception:
         return False
 
 
+def profile_flags(driver: WebDriver) -> tuple[bool, bool]:
+    """
+    (is_private, is_verified) con una sola llamada al navegador.
+    Ante error cae a las dos consultas individuales.
+    """
+    try:
+        res = driver.execute_script(_JS_PROFILE_FLAGS, list(_PRIVATE_MARKERS))
+        if isinstance(res, (list, tuple)) and len(res) == 2:
+            return bool(res[0]), bool(res[1])
+    except Exception:
+        pass
+    return is_profile_private(driver), is_profile_verified(driver)
+
+
 # ---------------------------------------------------------------------------
 # API principal para el caso de uso
 # ---------------------------------------------------------------------------
@@ -233,8 +339,9 @@ def get_profile_snapshot(driver: WebDriver, username: str, wait_seconds: int = 8
     except TimeoutException:
         logger.warning("[profile] %s header no disponible tras %ss", username, wait_seconds, extra=ctx)
 
-    # Popups (si aparece el popup de login, cerrarlo y seguir)
-    if close_instagram_login_popup(driver):
+    # Popups (si aparece el popup de login, cerrarlo y seguir). El header ya está:
+    # un popup que no apareció a esta altura no justifica esperar 5s más
+    if close_instagram_login_popup(driver, timeout=1):
         logger.info("[profile] %s popup de login cerrado", username, extra=ctx)
 
     # Extracciones robustas (reusan tus helpers actuales)
@@ -246,8 +353,7 @@ def get_profile_snapshot(driver: WebDriver, username: str, wait_seconds: int = 8
         stats["followings"] = stats.get("following")
 
     bio = extract_biography(driver)
-    is_verified = is_profile_verified(driver)
-    is_private = is_profile_private(driver)
+    is_private, is_verified = profile_flags(driver)
 
     # Log sintético para trazabilidad
     logger.info(
@@ -47,15 +47,20 @@ def has_reels(driver, timeout: float = 3.0) -> bool:
         return False
 
 
-# JS helpers: evitamos múltiples round-trips
-JS_GET_VIEWS = (
-    "const r=arguments[0];"
-    # Distintos contenedores que suele usar IG para el contador visible
-    "let el=r.querySelector(\"div._aagv span, div._aajy span, div._aaj_ span\");"
-    "return el ? el.textContent : '';"
+# Fallback de vistas: polling dentro del navegador (cada 50ms hasta arguments[1] ms)
+# en lugar de un WebDriverWait por XPath sobre todo el documento.
+JS_WAIT_VIEWS = (
+    "const r=arguments[0], maxMs=arguments[1], done=arguments[arguments.length-1];"
+    "let t=0;"
+    "const f=()=>{"
+    "const el=r.querySelector(\"div._aagv span, div._aajy span, div._aaj_ span\");"
+    "const txt=el ? (el.textContent||'').trim() : '';"
+    "if(txt){done(txt);return;}"
+    "if(t>=maxMs){done('');return;}"
+    "t+=50; setTimeout(f,50);};"
+    "f();"
 )
 
-
 JS_GET_HOVER_METRICS = (
     "const r=arguments[0];"
     "const ul=r.querySelector('ul.x6s0dn4, ul');"
@@ -68,6 +73,20 @@ JS_GET_HOVER_METRICS = (
 )
 
 
+# Un solo round-trip por reel: centra el reel y lee href, vistas, si tiene la
+# estructura de hover y, si el overlay ya está materializado, likes/comentarios.
+JS_REEL_SNAPSHOT = (
+    "const r=arguments[0];"
+    "r.scrollIntoView({block:'center'});"
+    "const v=r.querySelector(\"div._aagv span, div._aajy span, div._aaj_ span\");"
+    "const ul=r.querySelector('ul.x6s0dn4, ul');"
+    "const lis=ul ? ul.querySelectorAll('li') : [];"
+    "const txt=(li)=>{const s=li ? li.querySelector('span') : null; return s ? s.textContent.trim() : '';};"
+    "return {href: r.href || r.getAttribute('href') || '', views: v ? v.textContent : '',"
+    " hoverable: lis.length>=2, likes: txt(lis[0]), comments: txt(lis[1])};"
+)
+
+
 def hover_element_human_fast(
     driver,
     el,
@@ -109,31 +128,6 @@ def hover_element_human_fast(
         logger.debug("hover_element_human_fast: fallo no crítico: %s", e)
 
 
-def has_hover_available(driver, reel) -> bool:
-    """
-    Verificación rápida si un reel tiene hover disponible sin hacer hover.
-    - Detecta si el elemento tiene la estructura necesaria para mostrar métricas.
-    - Permite saltar reels que no tienen hover más rápido.
-    """
-    try:
-        # Verificar si existe la estructura de hover sin hacer hover
-        ul = driver.execute_script(
-            "const r=arguments[0]; return r.querySelector('ul.x6s0dn4, ul');", 
-            reel
-        )
-        if not ul:
-            return False
-            
-        # Verificar si tiene al menos 2 elementos li (likes y comments)
-        li_count = driver.execute_script(
-            "const ul=arguments[0]; return ul ? ul.querySelectorAll('li').length : 0;", 
-            ul
-        )
-        return li_count >= 2
-    except Exception:
-        return False
-
-
 # -----------------------------------------------------------------------------
 # API principal
 # -----------------------------------------------------------------------------
@@ -191,14 +185,14 @@ def extract_reel_metrics_list(
         reel = reels[idx]
         idx += 1
 
-        # URL y shortcode
-        href = ""
         try:
-            href = reel.get_attribute("href") or ""
+            snap = driver.execute_script(JS_REEL_SNAPSHOT, reel) or {}
         except Exception:
-            logger.debug("[reels] idx=%d sin href (DOM)", idx)
+            logger.debug("[reels] idx=%d snapshot JS fallido (DOM)", idx)
             continue
 
+        # URL y shortcode
+        href = snap.get("href") or ""
         if not href or href in seen:
             logger.debug("[reels] idx=%d duplicado o vacío", idx)
             continue
@@ -207,24 +201,14 @@ def extract_reel_metrics_list(
         row: Dict[str, int | str] = {"url": href, "code": _shortcode_from_href(href), "views": 0, "likes": 0, "comments": 0}
 
         try:
-            # Centrar el reel en viewport - mínima pausa
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", reel)
-            sleep_jitter(0.02, 0.05) if fast_mode else sleep_jitter(0.08, 0.08)
-
-            # --- Vistas (sin hover) - ultra-rápido ---
+            # --- Vistas (sin hover) - ya leídas en el snapshot ---
             try:
-                views_text = driver.execute_script(JS_GET_VIEWS, reel) or ""
+                views_text = snap.get("views") or ""
                 if not views_text.strip():
-                    # Verificación rápida - timeout mínimo
-                    try:
-                        WebDriverWait(driver, 0.25 if fast_mode else 0.5).until(
-                            EC.visibility_of_element_located(
-                                (By.XPATH, ".//div[contains(@class,'_aagv') or contains(@class,'_aajy') or contains(@class,'_aaj_')]//span")
-                            )
-                        )
-                        views_text = driver.execute_script(JS_GET_VIEWS, reel) or ""
-                    except TimeoutException:
-                        pass
+                    # Verificación rápida - un solo RPC con polling corto en el navegador
+                    views_text = driver.execute_async_script(
+                        JS_WAIT_VIEWS, reel, 250 if fast_mode else 500
+                    ) or ""
 
                 if not views_text.strip():
                     logger.debug("[reels] idx=%d sin vistas visibles", idx)
@@ -237,17 +221,17 @@ def extract_reel_metrics_list(
 
             # --- Likes / Comments (hover rápido) ---
             try:
-                # Verificación rápida previa: ¿tiene hover disponible?
-                if not has_hover_available(driver, reel):
+                # Verificación rápida previa: ¿tiene hover disponible? (del snapshot)
+                if not snap.get("hoverable"):
                     logger.debug("[reels] idx=%d sin hover disponible -> skip", idx)
                     continue
-                
-                # Hover ultra-rápido
-                hover_element_human_fast(driver, reel, scheduler=None)
-                sleep_jitter(0.04, 0.08) if fast_mode else sleep_jitter(0.12, 0.15)
 
-                # Verificación de métricas
-                pair = driver.execute_script(JS_GET_HOVER_METRICS, reel)
+                pair = [snap.get("likes") or "", snap.get("comments") or ""]
+                if not pair[0] or not pair[1]:
+                    # Contadores aún no materializados: hover humano real
+                    hover_element_human_fast(driver, reel, scheduler=None)
+                    sleep_jitter(0.04, 0.08) if fast_mode else sleep_jitter(0.12, 0.15)
+                    pair = driver.execute_script(JS_GET_HOVER_METRICS, reel)
                 if not pair or len(pair) < 2:
                     # Un solo intento adicional rápido
                     sleep_jitter(0.03, 0.05) if fast_mode else sleep_jitter(0.08, 0.1)
@@ -299,12 +283,19 @@ def extract_reel_metrics(
     """
     data = extract_reel_metrics_list(driver, limit=max_reels, scheduler=scheduler, fast_mode=fast_mode)
 
-    totals = {
-        "total_views": sum(int(d.get("views", 0) or 0) for d in data),
-        "total_likes": sum(int(d.get("likes", 0) or 0) for d in data),
-        "total_comments": sum(int(d.get("comments", 0) or 0) for d in data),
+    # Totales en una sola pasada
+    total_views = total_likes = total_comments = 0
+    for d in data:
+        total_views += int(d.get("views", 0) or 0)
+        total_likes += int(d.get("likes", 0) or 0)
+        total_comments += int(d.get("comments", 0) or 0)
+
+    totals: Dict[str, int | List[Dict[str, int | str]]] = {
+        "total_views": total_views,
+        "total_likes": total_likes,
+        "total_comments": total_comments,
         "reel_count": len(data),
-        "reel_data": data,
     }
     logger.info("[reels] totales=%s", totals)
+    totals["reel_data"] = data
     return totals
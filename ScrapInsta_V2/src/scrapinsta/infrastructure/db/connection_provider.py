@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import threading
+import weakref
 from typing import Callable, Optional, Dict, Any
 from urllib.parse import urlparse, unquote
 import pymysql
@@ -98,6 +100,72 @@ def _connect(params: Dict[str, Any]):
         raise e.last_error or e
 
 
+class _KeepOpenConnection:
+    """
+    Envoltorio de una conexión reutilizable: `close()` no cierra la conexión física,
+    así los repos mantienen su patrón abrir/cerrar por operación sin pagar connect+auth.
+    """
+    __slots__ = ("_con",)
+
+    def __init__(self, con) -> None:
+        self._con = con
+
+    def close(self) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        return getattr(self._con, name)
+
+
+class _ReusingConnections:
+    """
+    Una conexión por hilo que sobrevive entre operaciones (validada con ping en cada uso).
+
+    Registra las conexiones abiertas (WeakSet: la de un hilo que termina se libera con él)
+    para que close_all() cierre las de todos los hilos al apagar el worker. Tras close_all()
+    sigue siendo usable: la próxima llamada abre una conexión nueva.
+    """
+
+    def __init__(self, params: Dict[str, Any]) -> None:
+        self._params = params
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._opened: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def __call__(self):
+        local = self._local
+        con = getattr(local, "con", None)
+        if con is not None:
+            try:
+                con.ping(reconnect=True)
+                return _KeepOpenConnection(con)
+            except Exception:
+                try:
+                    con.close()
+                except Exception:
+                    pass
+                with self._lock:
+                    self._opened.discard(con)
+                local.con = None
+        con = _connect(self._params)
+        with self._lock:
+            self._opened.add(con)
+        local.con = con
+        return _KeepOpenConnection(con)
+
+    def close_all(self) -> None:
+        """Cierra las conexiones físicas de todos los hilos."""
+        with self._lock:
+            cons = list(self._opened)
+            self._opened.clear()
+            self._local = threading.local()
+        for con in cons:
+            try:
+                con.close()
+            except Exception:
+                pass
+
+
 class ConnectionProvider:
     """
     Proveedor OO usado por repos que esperan un objeto con __call__ o connect().
@@ -105,22 +173,43 @@ class ConnectionProvider:
         con = provider()             # usa __call__
         con = provider.connect()     # o método explícito
     """
-    def __init__(self, dsn_or_settings: Optional[str | Settings] = None) -> None:
+    def __init__(self, dsn_or_settings: Optional[str | Settings] = None, *, reuse: bool = False) -> None:
         self._params = _normalize_params(dsn_or_settings)
+        # reuse=True: una conexión por hilo que sobrevive entre operaciones
+        self._reusing: Optional[_ReusingConnections] = (
+            _ReusingConnections(self._params) if reuse else None
+        )
 
     def __call__(self):
-        return _connect(self._params)
+        return self.connect()
 
     def connect(self):
+        if self._reusing is not None:
+            return self._reusing()
         return _connect(self._params)
 
+    def close_all(self) -> None:
+        """Con reuse=True cierra las conexiones retenidas; sin reuse no hay nada que cerrar."""
+        if self._reusing is not None:
+            self._reusing.close_all()
 
-def make_mysql_conn_factory(dsn_or_settings: Optional[str | Settings] = None) -> Callable[[], Any]:
+
+def make_mysql_conn_factory(
+    dsn_or_settings: Optional[str | Settings] = None,
+    *,
+    reuse: bool = False,
+) -> Callable[[], Any]:
     """
     Proveedor funcional (callable) usado por repos que esperan conn_factory=callable.
+    Con reuse=True cada hilo reutiliza su conexión (ping en cada uso) y el close()
+    del repo no la cierra: evita connect+auth por operación en workers de larga vida.
+    El callable devuelto expone close_all() para cerrarlas al apagar.
     """
     params = _normalize_params(dsn_or_settings)
 
+    if reuse:
+        return _ReusingConnections(params)
+
     def _factory():
         return _connect(params)
 
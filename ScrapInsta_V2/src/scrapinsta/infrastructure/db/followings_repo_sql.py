@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Iterable, Optional, Protocol
+from typing import Callable, Iterable, Optional, Protocol, Sequence
 
 from scrapinsta.crosscutting.retry import retry
 from scrapinsta.domain.models.profile_models import Following, Username
@@ -155,3 +155,63 @@ class FollowingsRepoSQL(FollowingsRepo):
             finally:
                 conn.close()
 
+    @retry(DB_ERRORS)
+    def get_for_owners(
+        self,
+        owners: Sequence[Username],
+        limit_per: int | None = None,
+    ) -> dict[str, list[Following]]:
+        """
+        Versión batch de get_for_owner: resuelve varios owners con un único SELECT
+        (WHERE username_origin IN (...)) en lugar de una consulta por owner.
+
+        Devuelve un dict owner -> followings; los owners sin filas quedan con lista vacía.
+        Si 'limit_per' > 0, recorta por owner con ROW_NUMBER() (MySQL 8+ / Postgres).
+        """
+        keys = list(dict.fromkeys(o.value for o in owners))
+        out: dict[str, list[Following]] = {k: [] for k in keys}
+        if not keys:
+            return out
+
+        placeholders = ", ".join(["%s"] * len(keys))
+        params: list[object] = list(keys)
+
+        if limit_per is not None and limit_per > 0:
+            sql = (
+                "SELECT username_origin, username_target FROM ("
+                "SELECT username_origin, username_target, "
+                "ROW_NUMBER() OVER (PARTITION BY username_origin ORDER BY created_at) AS rn "
+                "FROM followings "
+                f"WHERE username_origin IN ({placeholders})"
+                ") ranked "
+                "WHERE rn <= %s"
+            )
+            params.append(limit_per)
+        else:
+            sql = (
+                "SELECT username_origin, username_target "
+                "FROM followings "
+                f"WHERE username_origin IN ({placeholders})"
+            )
+
+        conn = self._conn_factory()
+        cur: Optional[_Cursor] = None
+        try:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            # El conn_factory real usa DictCursor: filas como dict, se leen por columna
+            for row in cur.fetchall():
+                f = Following(
+                    owner=Username(value=row["username_origin"]),
+                    target=Username(value=row["username_target"]),
+                )
+                out.setdefault(f.owner.value, []).append(f)
+            return out
+        except Exception as e:
+            raise FollowingsPersistenceError("Fallo leyendo followings", cause=e) from e
+        finally:
+            try:
+                if cur is not None:
+                    cur.close()
+            finally:
+                conn.close()
@@ -46,12 +46,20 @@ class JobStoreSQL(JobStorePort):
         self._pool_max = int(pool_max)
         self._pool: Queue[pymysql.connections.Connection] = Queue(maxsize=self._pool_max)
         self._pool_lock = threading.Lock()
+        self._conn_kwargs: Optional[Dict[str, Any]] = None
+        self._connect_retries = 2
 
     # -----------------------
     # Conn helper
     # -----------------------
-    def _connect(self):
-        """Obtiene una conexión del pool o crea una nueva si hace falta."""
+    def _connect_kwargs(self) -> Dict[str, Any]:
+        """
+        Parámetros de pymysql.connect (DSN + env de timeouts/SSL), resueltos una sola vez
+        por instancia en vez de en cada checkout del pool.
+        """
+        if self._conn_kwargs is not None:
+            return self._conn_kwargs
+
         # Parse DSN con urllib.parse para mayor robustez.
         parsed = urlparse(self._dsn)
         if parsed.scheme != "mysql":
@@ -63,43 +71,49 @@ class JobStoreSQL(JobStorePort):
         db = (parsed.path or "").lstrip("/")
         if not host or not db:
             raise ValueError("DSN inválido: host y db son requeridos")
-        def _new_conn() -> pymysql.connections.Connection:
+
+        ssl_params = None
+        try:
+            ca = os.getenv("MYSQL_SSL_CA")
+            cert = os.getenv("MYSQL_SSL_CERT")
+            key = os.getenv("MYSQL_SSL_KEY")
+            if ca:
+                ssl_params = {"ca": ca}
+                if cert and key:
+                    ssl_params.update({"cert": cert, "key": key})
+        except Exception:
             ssl_params = None
-            try:
-                ca = os.getenv("MYSQL_SSL_CA")
-                cert = os.getenv("MYSQL_SSL_CERT")
-                key = os.getenv("MYSQL_SSL_KEY")
-                if ca:
-                    ssl_params = {"ca": ca}
-                    if cert and key:
-                        ssl_params.update({"cert": cert, "key": key})
-            except Exception:
-                ssl_params = None
-            connect_timeout = float(os.getenv("DB_CONNECT_TIMEOUT", "5.0"))
-            read_timeout = float(os.getenv("DB_READ_TIMEOUT", "10.0"))
-            write_timeout = float(os.getenv("DB_WRITE_TIMEOUT", "10.0"))
-            return pymysql.connect(
-                host=host,
-                port=int(port),
-                user=user,
-                password=pwd,
-                database=db,
-                charset="utf8mb4",
-                connect_timeout=connect_timeout,
-                read_timeout=read_timeout,
-                write_timeout=write_timeout,
-                autocommit=False,
-                cursorclass=pymysql.cursors.DictCursor,
-                ssl=ssl_params,
-            )
 
-        retries = int(os.getenv("DB_CONNECT_RETRIES", "2"))
+        kwargs = {
+            "host": host,
+            "port": int(port),
+            "user": user,
+            "password": pwd,
+            "database": db,
+            "charset": "utf8mb4",
+            "connect_timeout": float(os.getenv("DB_CONNECT_TIMEOUT", "5.0")),
+            "read_timeout": float(os.getenv("DB_READ_TIMEOUT", "10.0")),
+            "write_timeout": float(os.getenv("DB_WRITE_TIMEOUT", "10.0")),
+            "autocommit": False,
+            "cursorclass": pymysql.cursors.DictCursor,
+            "ssl": ssl_params,
+        }
+        self._conn_kwargs = kwargs
+        self._connect_retries = int(os.getenv("DB_CONNECT_RETRIES", "2"))
+        return kwargs
+
+    def _connect(self):
+        """Obtiene una conexión del pool o crea una nueva si hace falta."""
+        kwargs = self._connect_kwargs()
+
+        def _new_conn() -> pymysql.connections.Connection:
+            return pymysql.connect(**kwargs)
 
-        @retry((pymysql.err.OperationalError, pymysql.err.InterfaceError), max_retries=retries)
+        @retry((pymysql.err.OperationalError, pymysql.err.InterfaceError), max_retries=self._connect_retries)
         def _new_conn_retry() -> pymysql.connections.Connection:
             return _new_conn()
 
-        # Reusar una conexión del pool si hay
+        # Reusar una conexión del pool si hay (el ping valida/reconecta al sacarla)
         try:
             con = self._pool.get_nowait()
             try:
@@ -131,7 +145,11 @@ class JobStoreSQL(JobStorePort):
         return con
 
     def _return(self, con: pymysql.connections.Connection) -> None:
-        """Devuelve la conexión al pool (o la cierra si no se puede reutilizar)."""
+        """
+        Devuelve la conexión al pool (o la cierra si no se puede reutilizar).
+        No hace ping al devolver: _connect ya valida (y reconecta) al sacarla del pool,
+        así que acá sería un round-trip extra por operación.
+        """
         try:
             if con and not con._closed and not con.get_autocommit():
                 # Cerrar transacción abierta para evitar snapshots viejos
@@ -139,7 +157,6 @@ class JobStoreSQL(JobStorePort):
                     con.commit()
                 except Exception:
                     pass
-                con.ping(reconnect=True)
             try:
                 self._pool.put_nowait(con)
                 db_connections_active.set(self._pool.qsize())
@@ -68,7 +68,11 @@ def _start_worker_process(
             poll_interval_s=0.1,
             heartbeat_s=10.0,
         )
-        worker.run()
+        try:
+            worker.run()
+        finally:
+            # El driver vive todo el proceso; se cierra una sola vez al salir
+            factory.close()
 
     proc = mp.Process(target=_run, name=f"WorkerProc:{account}", daemon=True)
     proc.start()
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 import os
 
 from scrapinsta.config.settings import Settings
@@ -31,7 +31,7 @@ from scrapinsta.application.services.text_analysis import detect_rubro as keywor
 
 from scrapinsta.application.use_cases.analyze_profile import AnalyzeProfileUseCase
 from scrapinsta.application.use_cases.fetch_followings import FetchFollowingsUseCase
-from scrapinsta.application.use_cases.send_message import SendMessageUseCase
+from scrapinsta.application.use_cases.send_message import ProfileSnapshotCache, SendMessageUseCase
 
 log = get_logger("deps_factory")
 
@@ -66,8 +66,12 @@ class FactoryImpl(UseCaseFactory):
         self._browser: Optional[BrowserPort] = None
         self._profile_repo: Optional[ProfileRepository] = None
         self._followings_repo: Optional[FollowingsRepo] = None
+        # Conexiones DB reutilizadas por los repos; close() las cierra
+        self._db_conns: list[Any] = []
         self._sender: Optional[MessageSenderPort] = None
         self._composer: Optional[MessageComposerPort] = None
+        # Vive lo que vive el proceso del worker (sobrevive a la recreación del driver)
+        self._snapshot_cache = ProfileSnapshotCache()
         seed = hash(self._account) & 0xFFFFFFFF
         self._human_scheduler = HumanScheduler(HumanTempoConfig(seed=seed))
 
@@ -133,14 +137,16 @@ class FactoryImpl(UseCaseFactory):
     @property
     def profile_repo(self) -> ProfileRepository:
         if self._profile_repo is None:
-            cp = ConnectionProvider(self._settings.db_dsn)
+            cp = ConnectionProvider(self._settings.db_dsn, reuse=True)
+            self._db_conns.append(cp)
             self._profile_repo = ProfileRepoSQL(cp)
         return self._profile_repo
 
     @property
     def followings_repo(self) -> FollowingsRepo:
         if self._followings_repo is None:
-            factory = make_mysql_conn_factory(self._settings.db_dsn)
+            factory = make_mysql_conn_factory(self._settings.db_dsn, reuse=True)
+            self._db_conns.append(factory)
             self._followings_repo = FollowingsRepoSQL(conn_factory=factory)
         return self._followings_repo
 
@@ -203,6 +209,8 @@ class FactoryImpl(UseCaseFactory):
             browser=self.browser,
             profile_repo=self.profile_repo,
             cache_service=self.cache_service,
+            cache_fresh_s=self._settings.redis_cache_profile_ttl,
+            cache_max_age_s=self._settings.redis_cache_profile_max_age,
         )
 
     def create_fetch_followings(self) -> FetchFollowingsUseCase:
@@ -214,6 +222,7 @@ class FactoryImpl(UseCaseFactory):
             sender=self.sender,
             composer=self.composer,
             profile_repo=self.profile_repo,
+            snapshot_cache=self._snapshot_cache,
         )
 
     def close(self) -> None:
@@ -227,6 +236,12 @@ class FactoryImpl(UseCaseFactory):
             except Exception:
                 log.warning("driver_cleanup_failed", account=self._account)
             self._driver_manager = None
+        # Los repos siguen siendo válidos: el próximo uso abre una conexión nueva
+        for conns in self._db_conns:
+            try:
+                conns.close_all()
+            except Exception:
+                log.warning("db_connections_close_failed", account=self._account)
 
 
 _factory_cache: Dict[str, FactoryImpl] = {}
@@ -72,7 +72,8 @@ class InstagramWorker:
         self._stop_event = stop_event
         self._poll = max(0.1, float(poll_interval_s))
         self._hb = max(5.0, float(heartbeat_s))
-        self._last_hb = 0.0
+        # Reloj monotónico: inmune a saltos del reloj de pared (NTP); None = aún no se envió
+        self._last_hb: Optional[float] = None
         self._running = False
 
     # ---------------------------
@@ -93,12 +94,12 @@ class InstagramWorker:
     # Heartbeat
     # ---------------------------
     def _maybe_heartbeat(self) -> None:
-        now = time.time()
-        if (now - self._last_hb) >= self._hb:
+        now = time.monotonic()
+        if self._last_hb is None or (now - self._last_hb) >= self._hb:
             try:
                 self._send(ResultEnvelope(
                     ok=True,
-                    result={"type": "heartbeat", "worker": self._name, "ts": int(now)},
+                    result={"type": "heartbeat", "worker": self._name, "ts": int(time.time())},
                     attempts=1,
                 ))
             except Exception:
@@ -121,7 +122,7 @@ class InstagramWorker:
 
         self._install_signals()
         self._running = True
-        self._last_hb = 0.0
+        self._last_hb = None
 
         while self._running:
             if self._stop_event and self._stop_event():
@@ -152,7 +153,7 @@ class InstagramWorker:
 
             task_kind = getattr(env, "task", "unknown")
             account = getattr(env, "account_id", "unknown")
-            start_time = time.time()
+            start_time = time.monotonic()
 
             try:
                 # Cinturón y tirantes: idempotencia en consumer ante doble delivery (SQS/colas).
@@ -192,7 +193,7 @@ class InstagramWorker:
                         result.result = payload
                     except Exception:
                         pass
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 
                 task_duration_seconds.labels(kind=task_kind, account=account).observe(duration)
                 
@@ -216,7 +217,7 @@ class InstagramWorker:
                     log.debug("worker_ack_failed", worker=self._name)
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 error_type = type(e).__name__
                 
                 task_duration_seconds.labels(kind=task_kind, account=account).observe(duration)
@@ -67,6 +67,15 @@ class _PrioritizedJobRef:
     created_at: float
     job_id: str = field(compare=False)
 
+@dataclass(slots=True)
+class _TaskMeta:
+    """Task en vuelo: a qué cuenta se mandó y cuándo (una por task despachada)."""
+    account: str
+    username: str
+    job_id: str
+    start_time: float
+
+
 @dataclass
 class Job:
     """
@@ -101,10 +110,10 @@ class TokenBucket:
         self.capacity = max(1, int(capacity))
         self.refill_per_sec = float(refill_per_sec)
         self.tokens = float(capacity)
-        self.last = time.time()
+        self.last = time.monotonic()
 
     def _refill(self):
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last
         if elapsed > 0:
             self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_sec)
@@ -170,6 +179,10 @@ class Router:
             ) for a in self._accounts
         }
         self._rr = itertools.cycle(self._accounts)
+        # Join-Idle-Queue: cuentas sin tareas en vuelo, en orden de llegada.
+        # Borrado perezoso: una entrada con inflight > 0 se descarta al sacarla.
+        self._idle: Deque[str] = deque(dict.fromkeys(self._accounts))
+        self._idle_set: Set[str] = set(self._idle)
 
         self._acct_state: Dict[str, Dict[str, float | int]] = defaultdict(lambda: {
             "error_count": 0,
@@ -181,7 +194,7 @@ class Router:
         self._jobs: Dict[str, Job] = {}
         self._job_heap: List[_PrioritizedJobRef] = []
 
-        self._task_meta: Dict[str, Dict[str, Any]] = {}
+        self._task_meta: Dict[str, _TaskMeta] = {}
 
         self._acct_metrics: Dict[str, Dict[str, float]] = defaultdict(lambda: {
             "rt_avg": 3.0,
@@ -240,8 +253,9 @@ class Router:
                 if dispatched_now == 0 and not self._any_account_can_send():
                     break
 
+            # El total no depende de la cuenta: se suma una vez por tick, no una por cuenta
+            queued_count = sum(len(job.pending) for job in self._jobs.values() if not job.done)
             for acc in self._accounts:
-                queued_count = sum(len(job.pending) for job in self._jobs.values() if not job.done)
                 tasks_queued.labels(status="queued", account=acc).set(queued_count)
 
     def on_result(self, res: ResultEnvelope) -> None:
@@ -263,10 +277,12 @@ class Router:
 
             meta = self._task_meta.pop(task_id, None)
             if meta:
-                acc = meta["account"]
+                acc = meta.account
                 self._inflight[acc] = max(0, self._inflight.get(acc, 0) - 1)
+                if self._inflight[acc] == 0:
+                    self._mark_idle(acc)
 
-                start = meta.get("start_time")
+                start = meta.start_time
                 rt = max(0.0, (now - float(start))) if start else 0.0
                 m = self._acct_metrics[acc]
                 m["rt_avg"] = (m["rt_avg"] * 0.8) + (rt * 0.2)
@@ -280,7 +296,7 @@ class Router:
                 else:
                     self._mark_account_error(acc)
 
-                job_id = meta.get("job_id")
+                job_id = meta.job_id
                 if job_id and job_id in self._jobs:
                     job = self._jobs[job_id]
                     if ok:
@@ -310,14 +326,14 @@ class Router:
                                     "task_requeued_retryable",
                                     job_id=corr,
                                     task_id=task_id,
-                                    account=meta.get("account"),
-                                    kind=(self._jobs.get(meta.get("job_id")).kind if meta.get("job_id") in self._jobs else None),
-                                    username=meta.get("username"),
+                                    account=meta.account,
+                                    kind=(self._jobs.get(meta.job_id).kind if meta.job_id in self._jobs else None),
+                                    username=meta.username,
                                     max_attempts=max_attempts,
                                     reason=res_payload.get("retry_reason") if isinstance(res_payload, dict) else None,
                                 )
-                                job_id = meta.get("job_id")
-                                username = meta.get("username")
+                                job_id = meta.job_id
+                                username = meta.username
                                 if job_id and username and job_id in self._jobs:
                                     job = self._jobs[job_id]
                                     job.pending.add(username)
@@ -329,15 +345,15 @@ class Router:
                                     )
                             elif (not requeued) and meta:
                                 # retryable pero agotó el cap => cuenta como error definitivo para los contadores in-memory
-                                job_id = meta.get("job_id")
+                                job_id = meta.job_id
                                 if job_id and job_id in self._jobs:
                                     self._jobs[job_id].errors += 1
                                 self._log.warning(
                                     "task_retry_exhausted",
                                     job_id=corr,
                                     task_id=task_id,
-                                    account=meta.get("account"),
-                                    username=meta.get("username"),
+                                    account=meta.account,
+                                    username=meta.username,
                                     max_attempts=max_attempts,
                                     error=res.error,
                                 )
@@ -432,11 +448,16 @@ class Router:
                 heapq.heappush(tmp, jref)
         self._job_heap = tmp
 
+    def _can_take(self, acc: str) -> bool:
+        """Sin cooldown, con inflight bajo el máximo y con al menos un token."""
+        return (
+            self._is_account_available(acc)
+            and self._inflight[acc] < self._config.max_inflight_per_account
+            and self._limiters[acc].has(1)
+        )
+
     def _any_account_can_send(self) -> bool:
-        for a in self._accounts:
-            if self._is_account_available(a) and self._inflight[a] < self._config.max_inflight_per_account and self._limiters[a].has(1):
-                return True
-        return False
+        return any(self._can_take(a) for a in self._accounts)
 
     def _age_all_accounts(self) -> None:
         for a in self._accounts:
@@ -475,30 +496,69 @@ class Router:
         
         return load_score + urgency_score + token_score
 
+    def _mark_idle(self, acc: str) -> None:
+        if acc not in self._idle_set:
+            self._idle_set.add(acc)
+            self._idle.append(acc)
+
+    def _mark_idle_if_drained(self, acc: str) -> None:
+        """Devuelve a la cola de ociosas una cuenta elegida cuyo envío no llegó a salir."""
+        if self._inflight.get(acc, 0) == 0:
+            self._mark_idle(acc)
+
+    def _pop_idle(self) -> Optional[str]:
+        """
+        Primera cuenta ociosa (inflight == 0) que puede tomar trabajo.
+        Las que siguen ociosas pero están en cooldown o sin tokens pasan al final.
+        """
+        for _ in range(len(self._idle)):
+            acc = self._idle.popleft()
+            if self._inflight.get(acc, 0) != 0:
+                self._idle_set.discard(acc)
+                continue
+            if self._can_take(acc):
+                self._idle_set.discard(acc)
+                return acc
+            self._idle.append(acc)
+        return None
+
     def _pick_account(self) -> Optional[str]:
         """
-        Elige la mejor cuenta disponible:
+        Elige una cuenta disponible:
           - sin cooldown,
           - con inflight bajo el máximo configurado,
           - con tokens suficientes.
+        Join-Idle-Queue: si hay una cuenta ociosa se usa directamente, sin puntuar.
+        Bajo carga, power-of-two-choices: avanza el round-robin hasta juntar dos
+        cuentas elegibles y se queda con la de mejor score, en vez de evaluar y
+        puntuar todas las cuentas en cada tarea. Solo recorre todo el ciclo
+        cuando casi ninguna cuenta puede tomar trabajo.
         Consume 1 token cuando la elige.
         """
-        tried: Set[str] = set()
-        candidates: List[str] = []
+        idle = self._pop_idle()
+        if idle is not None:
+            if self._limiters[idle].consume(1):
+                self._urgency[idle] = 0.0
+                return idle
+            self._mark_idle(idle)
+            return None
+
+        first: Optional[str] = None
+        best: Optional[str] = None
         for _ in range(len(self._accounts)):
             acc = next(self._rr)
-            if acc in tried:
+            if acc == first or not self._can_take(acc):
+                continue
+            if first is None:
+                first = acc
                 continue
-            tried.add(acc)
-            if (self._is_account_available(acc) and 
-                self._inflight[acc] < self._config.max_inflight_per_account and 
-                self._limiters[acc].has(1)):
-                candidates.append(acc)
+            best = acc if self._score_for_account(acc) > self._score_for_account(first) else first
+            break
+        else:
+            best = first
 
-        if not candidates:
+        if best is None:
             return None
-
-        best = max(candidates, key=self._score_for_account)
         if self._limiters[best].consume(1):
             self._urgency[best] = 0.0
             return best
@@ -594,10 +654,12 @@ class Router:
                     # Si ya fue reclamada por otro dispatcher, NO enviamos duplicado.
                     if not self._job_store.claim_task(job.job_id, task_id, acc):
                         job.pending.discard(username)
+                        self._mark_idle_if_drained(acc)
                         continue
                 except Exception:
                     # Si falla el claim por cualquier razón, evitamos enviar duplicado.
                     job.pending.discard(username)
+                    self._mark_idle_if_drained(acc)
                     continue
 
             try:
@@ -611,21 +673,22 @@ class Router:
                     except Exception:
                         pass
                 job.pending.discard(username)
+                self._mark_idle_if_drained(acc)
                 continue
 
-            self._task_meta[task_id] = {
-                "account": acc,
-                "username": username,
-                "job_id": job.job_id,
-                "start_time": self._now(),
-            }
+            self._task_meta[task_id] = _TaskMeta(
+                account=acc,
+                username=username,
+                job_id=job.job_id,
+                start_time=self._now(),
+            )
             self._inflight[acc] = self._inflight.get(acc, 0) + 1
             job.pending.discard(username)
             job.dispatched += 1
             sent += 1
 
         if not job.pending:
-            still = any(m.get("job_id") == job.job_id for m in self._task_meta.values())
+            still = any(m.job_id == job.job_id for m in self._task_meta.values())
             job.done = not still
 
         return sent
@@ -9,6 +9,7 @@ Este archivo proporciona:
 """
 from __future__ import annotations
 
+import copy
 from typing import Generator
 from unittest.mock import Mock, MagicMock, patch
 
@@ -29,10 +30,10 @@ from scrapinsta.domain.ports.browser_port import BrowserPort
 # Fixture: Mocks de Repositorios (para tests unitarios)
 # =========================================================
 
-@pytest.fixture
-def mock_profile_repo() -> Mock:
+@pytest.fixture(scope="session")
+def _profile_repo_prototype() -> Mock:
     """
-    Mock de ProfileRepository para tests unitarios.
+    Prototipo de ProfileRepository construido una sola vez por sesión.
     
     No usa base de datos real, retorna datos predefinidos.
     """
@@ -59,6 +60,17 @@ def mock_profile_repo() -> Mock:
     return mock
 
 
+@pytest.fixture
+def mock_profile_repo(_profile_repo_prototype: Mock) -> Mock:
+    """
+    Mock de ProfileRepository para tests unitarios.
+    
+    Copia profunda del prototipo de sesión: cada test recibe un mock
+    independiente sin volver a recorrer el spec del puerto.
+    """
+    return copy.deepcopy(_profile_repo_prototype)
+
+
 @pytest.fixture
 def mock_followings_repo() -> Mock:
     """
@@ -79,6 +91,7 @@ def mock_followings_repo() -> Mock:
     
     # get_for_owner
     mock.get_for_owner.return_value = []
+    mock.get_for_owners.return_value = {}
     
     return mock
 
@@ -110,10 +123,10 @@ def test_settings() -> Settings:
 # Fixture: Mock de BrowserPort (sin Selenium real)
 # =========================================================
 
-@pytest.fixture
-def mock_browser_port() -> Mock:
+@pytest.fixture(scope="session")
+def _browser_port_prototype() -> Mock:
     """
-    Mock completo de BrowserPort que NO ejecuta Selenium.
+    Prototipo del mock de BrowserPort construido una sola vez por sesión.
     
     Retorna datos de prueba predefinidos.
     
@@ -194,6 +207,16 @@ def mock_browser_port() -> Mock:
     return mock
 
 
+@pytest.fixture
+def mock_browser_port(_browser_port_prototype: Mock) -> Mock:
+    """
+    Mock completo de BrowserPort que NO ejecuta Selenium.
+    
+    Copia profunda del prototipo de sesión (ver _browser_port_prototype).
+    """
+    return copy.deepcopy(_browser_port_prototype)
+
+
 # =========================================================
 # Fixture: Mock de OpenAI (sin llamadas reales)
 # =========================================================
@@ -260,10 +283,10 @@ def mock_job_store() -> Mock:
 # Fixture: Mock de MessageSenderPort
 # =========================================================
 
-@pytest.fixture
-def mock_message_sender() -> Mock:
+@pytest.fixture(scope="session")
+def _message_sender_prototype() -> Mock:
     """
-    Mock de MessageSenderPort que NO envía mensajes reales.
+    Prototipo de MessageSenderPort construido una sola vez por sesión.
     """
     from scrapinsta.domain.ports.message_port import MessageSenderPort
     
@@ -273,14 +296,22 @@ def mock_message_sender() -> Mock:
     return mock
 
 
+@pytest.fixture
+def mock_message_sender(_message_sender_prototype: Mock) -> Mock:
+    """
+    Mock de MessageSenderPort que NO envía mensajes reales.
+    """
+    return copy.deepcopy(_message_sender_prototype)
+
+
 # =========================================================
 # Fixture: Mock de MessageComposerPort
 # =========================================================
 
-@pytest.fixture
-def mock_message_composer() -> Mock:
+@pytest.fixture(scope="session")
+def _message_composer_prototype() -> Mock:
     """
-    Mock de MessageComposerPort que NO usa OpenAI real.
+    Prototipo de MessageComposerPort construido una sola vez por sesión.
     """
     from scrapinsta.domain.ports.message_port import MessageComposerPort
     
@@ -290,6 +321,14 @@ def mock_message_composer() -> Mock:
     return mock
 
 
+@pytest.fixture
+def mock_message_composer(_message_composer_prototype: Mock) -> Mock:
+    """
+    Mock de MessageComposerPort que NO usa OpenAI real.
+    """
+    return copy.deepcopy(_message_composer_prototype)
+
+
 # =========================================================
 # Utilidades para tests
 # =========================================================
@@ -192,4 +192,48 @@ class TestFollowingsRepoSQL:
         
         with pytest.raises(FollowingsPersistenceError):
             repo.get_for_owner(owner)
-
+    
+    def test_get_for_owners_single_query(self, mock_conn_factory, mock_db_cursor, mock_db_connection):
+        """Resuelve varios owners con un único SELECT ... IN (...) y filas dict (DictCursor)."""
+        mock_db_cursor.fetchall.return_value = [
+            {"username_origin": "owner_a", "username_target": "target1"},
+            {"username_origin": "owner_b", "username_target": "target2"},
+            {"username_origin": "owner_a", "username_target": "target3"},
+        ]
+        mock_db_connection.cursor.return_value = mock_db_cursor
+        
+        repo = FollowingsRepoSQL(conn_factory=mock_conn_factory)
+        owners = [Username(value="owner_a"), Username(value="owner_b"), Username(value="owner_c")]
+        
+        result = repo.get_for_owners(owners)
+        
+        assert [f.target.value for f in result["owner_a"]] == ["target1", "target3"]
+        assert [f.target.value for f in result["owner_b"]] == ["target2"]
+        assert result["owner_c"] == []
+        
+        mock_db_cursor.execute.assert_called_once()
+        sql_called, params = mock_db_cursor.execute.call_args[0]
+        assert "WHERE username_origin IN (%s, %s, %s)" in sql_called
+        assert params == ["owner_a", "owner_b", "owner_c"]
+    
+    def test_get_for_owners_limit_per_owner(self, mock_conn_factory, mock_db_cursor, mock_db_connection):
+        """Con limit_per recorta por owner usando ROW_NUMBER()."""
+        mock_db_cursor.fetchall.return_value = []
+        mock_db_connection.cursor.return_value = mock_db_cursor
+        
+        repo = FollowingsRepoSQL(conn_factory=mock_conn_factory)
+        owners = [Username(value="owner_a"), Username(value="owner_b")]
+        
+        repo.get_for_owners(owners, limit_per=5)
+        
+        sql_called, params = mock_db_cursor.execute.call_args[0]
+        assert "ROW_NUMBER() OVER (PARTITION BY username_origin" in sql_called
+        assert "rn <= %s" in sql_called
+        assert params == ["owner_a", "owner_b", 5]
+    
+    def test_get_for_owners_empty(self, mock_conn_factory, mock_db_connection):
+        """Sin owners no abre conexión."""
+        repo = FollowingsRepoSQL(conn_factory=mock_conn_factory)
+        
+        assert repo.get_for_owners([]) == {}
+        mock_db_connection.cursor.assert_not_called()
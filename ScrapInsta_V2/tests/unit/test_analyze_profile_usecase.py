@@ -5,6 +5,8 @@ Usa mocks para BrowserPort y ProfileRepository, no ejecuta Selenium ni BD real.
 """
 from __future__ import annotations
 
+import time
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock
@@ -251,3 +253,111 @@ class TestAnalyzeProfileUseCase:
         
         mock_browser_port.get_profile_snapshot.assert_called_once_with("testuser")
 
+
+
+class TestAnalyzeProfileCache:
+    """Tests para el caché del análisis (frescura por cached_at, edad máxima por TTL)."""
+
+    @pytest.fixture
+    def sample_profile_snapshot(self) -> ProfileSnapshot:
+        return ProfileSnapshot(
+            username="testuser",
+            bio="Bio",
+            followers=1000,
+            followings=500,
+            posts=100,
+            is_verified=False,
+            privacy=PrivacyStatus.public,
+        )
+
+    @staticmethod
+    def _cache_with(snapshot: ProfileSnapshot, age_s: float) -> Mock:
+        from scrapinsta.application.dto.cache_serialization import serialize_analyze_profile_response
+
+        data = serialize_analyze_profile_response(
+            AnalyzeProfileResponse(snapshot=snapshot, recent_reels=[], recent_posts=[], basic_stats=None)
+        )
+        data["cached_at"] = time.time() - age_s
+        cache = Mock()
+        cache.get_profile_analysis.return_value = data
+        return cache
+
+    def test_fresh_hit_skips_browser_and_saves(
+        self,
+        mock_browser_port: Mock,
+        mock_profile_repo: Mock,
+        sample_profile_snapshot: ProfileSnapshot,
+    ):
+        cache = self._cache_with(sample_profile_snapshot, age_s=60)
+        use_case = AnalyzeProfileUseCase(
+            browser=mock_browser_port, profile_repo=mock_profile_repo, cache_service=cache
+        )
+
+        response = use_case(AnalyzeProfileRequest(username="testuser"))
+
+        assert response.snapshot.username == sample_profile_snapshot.username
+        mock_browser_port.get_profile_snapshot.assert_not_called()
+        mock_profile_repo.save_analysis_snapshot.assert_called_once()
+
+    def test_stale_hit_served_without_db_resave(
+        self,
+        mock_browser_port: Mock,
+        mock_profile_repo: Mock,
+        sample_profile_snapshot: ProfileSnapshot,
+    ):
+        """Con edad máxima ampliada, pasada la ventana fresca se sirve sin re-guardar en BD."""
+        cache = self._cache_with(sample_profile_snapshot, age_s=2 * 3600)
+        use_case = AnalyzeProfileUseCase(
+            browser=mock_browser_port,
+            profile_repo=mock_profile_repo,
+            cache_service=cache,
+            cache_max_age_s=86400,
+        )
+
+        response = use_case(AnalyzeProfileRequest(username="testuser"))
+
+        assert response.snapshot is not None
+        mock_browser_port.get_profile_snapshot.assert_not_called()
+        mock_profile_repo.upsert_profile.assert_not_called()
+        mock_profile_repo.save_analysis_snapshot.assert_not_called()
+
+    def test_max_age_defaults_to_fresh_ttl(
+        self,
+        mock_browser_port: Mock,
+        mock_profile_repo: Mock,
+    ):
+        """Sin edad máxima explícita, el TTL en Redis es el fresco (no se sirve nada viejo)."""
+        cache = Mock()
+        cache.get_profile_analysis.return_value = None
+        use_case = AnalyzeProfileUseCase(
+            browser=mock_browser_port,
+            profile_repo=mock_profile_repo,
+            cache_service=cache,
+            cache_fresh_s=60,
+        )
+
+        use_case(AnalyzeProfileRequest(username="testuser", fetch_reels=False))
+
+        assert cache.set_profile_analysis.call_args[1] == {"ttl": 60}
+
+    def test_miss_caches_with_max_age_ttl(
+        self,
+        mock_browser_port: Mock,
+        mock_profile_repo: Mock,
+    ):
+        cache = Mock()
+        cache.get_profile_analysis.return_value = None
+        use_case = AnalyzeProfileUseCase(
+            browser=mock_browser_port,
+            profile_repo=mock_profile_repo,
+            cache_service=cache,
+            cache_fresh_s=60,
+            cache_max_age_s=600,
+        )
+
+        use_case(AnalyzeProfileRequest(username="testuser", fetch_reels=False))
+
+        username, data = cache.set_profile_analysis.call_args[0]
+        assert username == "testuser"
+        assert "cached_at" in data
+        assert cache.set_profile_analysis.call_args[1] == {"ttl": 600}
@@ -0,0 +1,98 @@
+"""
+Tests para la reutilización de conexiones del connection_provider.
+"""
+import threading
+
+import pytest
+from unittest.mock import Mock
+
+from scrapinsta.infrastructure.db import connection_provider
+from scrapinsta.infrastructure.db.connection_provider import (
+    ConnectionProvider,
+    make_mysql_conn_factory,
+)
+
+
+@pytest.fixture
+def fake_connect(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Reemplaza _connect por un mock que devuelve una conexión nueva por llamada."""
+    connect = Mock(side_effect=lambda params: Mock(name="conn"))
+    monkeypatch.setattr(connection_provider, "_connect", connect)
+    return connect
+
+
+class TestReusingConnFactory:
+    """Tests para make_mysql_conn_factory(reuse=True)."""
+
+    def test_without_reuse_opens_per_call(self, fake_connect: Mock):
+        factory = make_mysql_conn_factory("mysql://u:p@h:3306/db")
+        factory()
+        factory()
+        assert fake_connect.call_count == 2
+
+    def test_reuse_keeps_connection_open(self, fake_connect: Mock):
+        """El close() del repo no cierra la conexión física y la siguiente llamada la reutiliza."""
+        factory = make_mysql_conn_factory("mysql://u:p@h:3306/db", reuse=True)
+
+        first = factory()
+        first.cursor()
+        first.close()
+        second = factory()
+
+        assert fake_connect.call_count == 1
+        raw = first._con
+        assert second._con is raw
+        raw.close.assert_not_called()
+        raw.ping.assert_called_once_with(reconnect=True)
+
+    def test_reuse_reconnects_when_ping_fails(self, fake_connect: Mock):
+        """Si la conexión cacheada no responde al ping se descarta y se abre otra."""
+        factory = make_mysql_conn_factory("mysql://u:p@h:3306/db", reuse=True)
+
+        stale = factory()._con
+        stale.ping.side_effect = Exception("gone away")
+        fresh = factory()._con
+
+        assert fresh is not stale
+        stale.close.assert_called_once()
+        assert fake_connect.call_count == 2
+
+    def test_reuse_is_per_thread(self, fake_connect: Mock):
+        """Cada hilo tiene su propia conexión (pymysql no es thread-safe)."""
+        factory = make_mysql_conn_factory("mysql://u:p@h:3306/db", reuse=True)
+        main = factory()._con
+        other = []
+        t = threading.Thread(target=lambda: other.append(factory()._con))
+        t.start()
+        t.join()
+
+        assert other[0] is not main
+        assert fake_connect.call_count == 2
+
+    def test_connection_provider_reuse(self, fake_connect: Mock):
+        cp = ConnectionProvider("mysql://u:p@h:3306/db", reuse=True)
+        assert cp()._con is cp.connect()._con
+        assert fake_connect.call_count == 1
+
+    def test_close_all_closes_connections_of_every_thread(self, fake_connect: Mock):
+        """close_all() cierra la conexión física de cada hilo y la siguiente llamada reconecta."""
+        factory = make_mysql_conn_factory("mysql://u:p@h:3306/db", reuse=True)
+        main = factory()._con
+        other = []
+        t = threading.Thread(target=lambda: other.append(factory()._con))
+        t.start()
+        t.join()
+
+        factory.close_all()
+
+        main.close.assert_called_once()
+        other[0].close.assert_called_once()
+        assert factory()._con is not main
+        assert fake_connect.call_count == 3
+
+    def test_connection_provider_close_all(self, fake_connect: Mock):
+        cp = ConnectionProvider("mysql://u:p@h:3306/db", reuse=True)
+        raw = cp()._con
+        cp.close_all()
+        raw.close.assert_called_once()
+        ConnectionProvider("mysql://u:p@h:3306/db").close_all()
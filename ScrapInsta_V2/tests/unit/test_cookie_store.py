@@ -0,0 +1,255 @@
+"""
+Tests para cookie_store (persistencia de cookies por cuenta).
+"""
+import json
+import os
+
+import pytest
+from unittest.mock import Mock
+
+from scrapinsta.infrastructure.auth import cookie_store
+from scrapinsta.infrastructure.auth.cookie_store import (
+    _filter_cookie_fields,
+    cookie_path,
+    cookies_dir,
+    has_sessionid,
+    load_cookies,
+    save_cookies,
+)
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Redirige DATA_DIR a un directorio temporal y limpia el cache del directorio."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    cookies_dir.cache_clear()
+    yield tmp_path
+    cookies_dir.cache_clear()
+
+
+def _write_cookies(username: str, cookies: list) -> None:
+    cookie_path(username).write_text(json.dumps(cookies), encoding="utf-8")
+
+
+class TestCookiesDir:
+    """Tests para la resolución del directorio de cookies."""
+
+    def test_cookies_dir_under_data_dir(self, data_dir):
+        """El directorio de cookies cuelga de DATA_DIR y se crea."""
+        path = cookies_dir()
+        assert path == data_dir / "cookies"
+        assert path.is_dir()
+
+    def test_cookies_dir_resolves_settings_once(self, monkeypatch: pytest.MonkeyPatch):
+        """Settings() se construye una sola vez aunque se pidan varias rutas."""
+        calls = []
+        real_settings = cookie_store.Settings
+
+        def _counting_settings(*args, **kwargs):
+            calls.append(1)
+            return real_settings(*args, **kwargs)
+
+        monkeypatch.setattr(cookie_store, "Settings", _counting_settings)
+
+        cookie_path("user_a")
+        cookie_path("user_b")
+        has_sessionid("user_a")
+
+        assert len(calls) == 1
+
+
+class TestHasSessionid:
+    """Tests para has_sessionid."""
+
+    def test_missing_file(self):
+        assert has_sessionid("nobody") is False
+
+    def test_valid_sessionid(self):
+        _write_cookies("user", [
+            {"name": "csrftoken", "value": "x"},
+            {"name": "sessionid", "value": "abc", "expiry": 4102444800},
+        ])
+        assert has_sessionid("user") is True
+
+    def test_expired_sessionid(self):
+        _write_cookies("user", [{"name": "sessionid", "value": "abc", "expiry": 1}])
+        assert has_sessionid("user") is False
+
+    def test_sessionid_without_expiry(self):
+        _write_cookies("user", [{"name": "sessionid", "value": "abc"}])
+        assert has_sessionid("user") is True
+
+    def test_any_valid_sessionid_counts(self):
+        """Con varias cookies 'sessionid' vale la de mayor expiry, no la primera."""
+        _write_cookies("user", [
+            {"name": "sessionid", "value": "old", "domain": "instagram.com", "expiry": 1},
+            {"name": "sessionid", "value": "abc", "domain": ".instagram.com", "expiry": 4102444800},
+        ])
+        assert has_sessionid("user") is True
+
+    def test_invalid_json(self):
+        cookie_path("user").write_text("{not json", encoding="utf-8")
+        assert has_sessionid("user") is False
+
+    def test_cached_until_file_changes(self, monkeypatch: pytest.MonkeyPatch):
+        """Con el mismo mtime no se vuelve a leer el archivo; al reescribirlo sí."""
+        _write_cookies("user", [{"name": "sessionid", "value": "abc"}])
+        reads = []
+        real_read = cookie_store._read_sessionid
+
+        def _counting_read(path):
+            reads.append(path)
+            return real_read(path)
+
+        monkeypatch.setattr(cookie_store, "_read_sessionid", _counting_read)
+
+        assert has_sessionid("user") is True
+        assert has_sessionid("user") is True
+        assert len(reads) == 1
+
+        _write_cookies("user", [{"name": "csrftoken", "value": "x"}])
+        path = cookie_path("user")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert has_sessionid("user") is False
+        assert len(reads) == 2
+
+    def test_cache_invalidated_on_same_mtime_rewrite(self):
+        """Una reescritura que conserva el mtime se detecta por tamaño/inode."""
+        _write_cookies("user", [{"name": "sessionid", "value": "abc"}])
+        path = cookie_path("user")
+        st = path.stat()
+        assert has_sessionid("user") is True
+
+        _write_cookies("user", [{"name": "csrftoken", "value": "token-value"}])
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert has_sessionid("user") is False
+
+    def test_cached_expiry_is_rechecked(self, monkeypatch: pytest.MonkeyPatch):
+        """El cache guarda el expiry, no el resultado: una cookie puede vencer sin cambiar el archivo."""
+        _write_cookies("user", [{"name": "sessionid", "value": "abc", "expiry": 1000}])
+        monkeypatch.setattr(cookie_store.time, "time", lambda: 999)
+        assert has_sessionid("user") is True
+        monkeypatch.setattr(cookie_store.time, "time", lambda: 1001)
+        assert has_sessionid("user") is False
+
+
+class TestSaveCookies:
+    """Tests para save_cookies."""
+
+    def test_save_roundtrip(self, data_dir):
+        """Guarda las cookies del driver y has_sessionid las reconoce."""
+        driver = Mock()
+        driver.get_cookies.return_value = [
+            {"name": "sessionid", "value": "abc", "domain": ".instagram.com"},
+            {"name": "ds_user", "value": "ñandú"},
+        ]
+
+        save_cookies(driver, "User")
+
+        path = cookie_path("user")
+        assert json.loads(path.read_text(encoding="utf-8")) == driver.get_cookies.return_value
+        assert not path.with_name(path.name + ".tmp").exists()
+        assert has_sessionid("user") is True
+
+    def test_save_keeps_previous_file_on_failure(self, monkeypatch: pytest.MonkeyPatch):
+        """Si falla el reemplazo, el archivo anterior queda intacto."""
+        _write_cookies("user", [{"name": "sessionid", "value": "old"}])
+        driver = Mock()
+        driver.get_cookies.return_value = [{"name": "sessionid", "value": "new"}]
+
+        def _boom(*_args, **_kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(cookie_store.os, "replace", _boom)
+
+        with pytest.raises(OSError):
+            save_cookies(driver, "user")
+
+        data = json.loads(cookie_path("user").read_text(encoding="utf-8"))
+        assert data == [{"name": "sessionid", "value": "old"}]
+        assert not cookie_path("user").with_name("user.json.tmp").exists()
+
+
+class TestFilterCookieFields:
+    """Tests para _filter_cookie_fields."""
+
+    def test_filters_in_place(self):
+        """Descarta campos desconocidos, normaliza tipos y reutiliza el dict."""
+        raw = {
+            "name": "sessionid",
+            "value": "abc",
+            "expiry": "1700000000.5",
+            "httpOnly": "True",
+            "secure": "false",
+            "hostOnly": True,
+            "storeId": "0",
+        }
+
+        out = _filter_cookie_fields(raw)
+
+        assert out is raw
+        assert out == {
+            "name": "sessionid",
+            "value": "abc",
+            "expiry": 1700000000,
+            "httpOnly": True,
+            "secure": False,
+            "path": "/",
+        }
+
+    def test_drops_invalid_expiry(self):
+        out = _filter_cookie_fields({"name": "a", "value": "b", "expiry": "nunca"})
+        assert "expiry" not in out
+
+
+class TestLoadCookies:
+    """Tests para load_cookies."""
+
+    _COOKIES = [
+        {"name": "sessionid", "value": "abc", "domain": ".instagram.com", "expiry": 4102444800, "sameSite": "lax"},
+        {"name": "csrftoken", "value": "tok", "hostOnly": False},
+    ]
+
+    def test_load_via_cdp_single_call(self):
+        """Con Chromium se restauran todas las cookies en un solo Network.setCookies."""
+        _write_cookies("user", self._COOKIES)
+        driver = Mock()
+
+        assert load_cookies(driver, "user") is True
+
+        driver.execute_cdp_cmd.assert_called_once()
+        cmd, params = driver.execute_cdp_cmd.call_args[0]
+        assert cmd == "Network.setCookies"
+        assert params["cookies"] == [
+            {
+                "name": "sessionid",
+                "value": "abc",
+                "domain": ".instagram.com",
+                "path": "/",
+                "expires": 4102444800.0,
+                "sameSite": "Lax",
+            },
+            {"name": "csrftoken", "value": "tok", "domain": ".instagram.com", "path": "/"},
+        ]
+        driver.add_cookie.assert_not_called()
+        driver.get.assert_not_called()
+
+    def test_load_falls_back_to_add_cookie(self):
+        """Si CDP falla se usa add_cookie por cookie."""
+        _write_cookies("user", self._COOKIES)
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = Exception("not chromium")
+
+        assert load_cookies(driver, "user") is True
+        driver.get.assert_called_once_with("https://www.instagram.com/")
+        assert driver.add_cookie.call_count == 2
+
+    def test_load_requires_sessionid(self):
+        _write_cookies("user", [{"name": "csrftoken", "value": "tok"}])
+        driver = Mock()
+
+        assert load_cookies(driver, "user") is False
+        driver.execute_cdp_cmd.assert_not_called()
@@ -35,6 +35,16 @@ class TestEngagementBenchmark:
         """Test para cuenta mega (> 1M followers)."""
         assert get_engagement_benchmark(2000000) == 0.0266
 
+    @pytest.mark.parametrize("followers, expected", [
+        (4_999, 0.0608), (5_000, 0.048),
+        (19_999, 0.048), (20_000, 0.051),
+        (99_999, 0.051), (100_000, 0.0378),
+        (999_999, 0.0378), (1_000_000, 0.0266),
+    ])
+    def test_engagement_benchmark_bucket_limits(self, followers, expected):
+        """El límite de cada bucket pertenece al bucket siguiente (followers < limit)."""
+        assert get_engagement_benchmark(followers) == expected
+
 
 class TestViewsBenchmark:
     """Tests para benchmarks de views."""
@@ -51,6 +61,16 @@ class TestViewsBenchmark:
         """Test para cuenta grande."""
         assert get_views_benchmark(200000) == 0.04
 
+    @pytest.mark.parametrize("followers, expected", [
+        (4_999, 0.20), (5_000, 0.102),
+        (9_999, 0.102), (10_000, 0.08),
+        (49_999, 0.08), (50_000, 0.05),
+        (99_999, 0.05), (100_000, 0.04),
+    ])
+    def test_views_benchmark_bucket_limits(self, followers, expected):
+        """El límite de cada bucket pertenece al bucket siguiente (followers < limit)."""
+        assert get_views_benchmark(followers) == expected
+
 
 class TestCalculateEngagementScore:
     """Tests para cálculo de engagement score."""
@@ -0,0 +1,53 @@
+"""
+Tests para las esperas en navegador del login_flow.
+"""
+import pytest
+from unittest.mock import Mock
+
+from scrapinsta.infrastructure.auth import login_flow
+from scrapinsta.infrastructure.browser.core.browser_utils import wait_for_any_xpath
+
+
+@pytest.fixture(autouse=True)
+def _no_dom_wait(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(login_flow, "wait_dom_interactive", lambda *_a, **_k: True)
+
+
+class TestWaitForAnyXpath:
+    """Tests para wait_for_any_xpath."""
+
+    def test_returns_index_from_script(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = 2
+
+        assert wait_for_any_xpath(driver, ["//a", "//b", "//c"], timeout=1.5) == 2
+        _, xpaths, ms = driver.execute_async_script.call_args[0]
+        assert xpaths == ["//a", "//b", "//c"]
+        assert ms == 1500
+
+    def test_returns_none_when_script_fails(self):
+        driver = Mock()
+        driver.execute_async_script.side_effect = Exception("document unloaded")
+
+        assert wait_for_any_xpath(driver, ["//a"]) is None
+
+
+class TestIsLoggedIn:
+    """Tests para _is_logged_in."""
+
+    @pytest.mark.parametrize("idx,expected", [(0, True), (3, True), (-1, False)])
+    def test_uses_in_page_wait(self, monkeypatch: pytest.MonkeyPatch, idx: int, expected: bool):
+        monkeypatch.setattr(login_flow, "wait_for_any_xpath", lambda *_a, **_k: idx)
+        driver = Mock()
+
+        assert login_flow._is_logged_in(driver, timeout=1) is expected
+        driver.find_element.assert_not_called()
+
+    def test_falls_back_to_polling(self, monkeypatch: pytest.MonkeyPatch):
+        """Si el script no corre, se usa WebDriverWait sobre las mismas XPaths."""
+        monkeypatch.setattr(login_flow, "wait_for_any_xpath", lambda *_a, **_k: None)
+        driver = Mock()
+        driver.find_element.return_value = Mock()
+
+        assert login_flow._is_logged_in(driver, timeout=1) is True
+        driver.find_element.assert_called()
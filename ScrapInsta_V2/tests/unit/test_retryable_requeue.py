@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock
 
 from scrapinsta.application.dto.tasks import ResultEnvelope
-from scrapinsta.interface.workers.router import Router, RouterConfig, Job
+from scrapinsta.interface.workers.router import Router, RouterConfig, Job, _TaskMeta
 
 
 def test_router_requeues_retryable_result_and_restores_pending():
@@ -23,7 +23,7 @@ def test_router_requeues_retryable_result_and_restores_pending():
     router.add_job(job)
 
     # Simular que ya se despachó y está en vuelo (meta)
-    router._task_meta[task_id] = {"account": "acc1", "username": username, "job_id": job_id, "start_time": router._now()}
+    router._task_meta[task_id] = _TaskMeta(account="acc1", username=username, job_id=job_id, start_time=router._now())
     router._inflight["acc1"] = 1
     router._jobs[job_id].pending.discard(username)
 
@@ -0,0 +1,107 @@
+"""
+Tests para la elección de cuenta del Router (power-of-two-choices).
+"""
+from unittest.mock import Mock, patch
+
+from scrapinsta.application.dto.tasks import ResultEnvelope
+from scrapinsta.interface.workers.router import Job, Router, RouterConfig, _TaskMeta
+
+
+def _router(accounts, **cfg) -> Router:
+    return Router(
+        accounts=accounts,
+        send_fn_by_account={a: (lambda _env: None) for a in accounts},
+        config=RouterConfig(**cfg),
+    )
+
+
+def test_pick_scores_at_most_two_accounts():
+    """Bajo carga (sin cuentas ociosas) solo se puntúan dos cuentas por elección."""
+    router = _router([f"acc{i}" for i in range(20)])
+    for acc in router._accounts:
+        router._inflight[acc] = 1
+
+    with patch.object(Router, "_score_for_account", autospec=True, return_value=0.5) as score:
+        assert router._pick_account() is not None
+
+    assert score.call_count == 2
+
+
+def test_pick_prefers_less_loaded_of_the_two():
+    """Ambas en vuelo (sin atajo JIQ): decide el score de power-of-two-choices."""
+    router = _router(["busy", "light"], max_inflight_per_account=4)
+    router._inflight["busy"] = 3
+    router._inflight["light"] = 1
+
+    with patch.object(
+        Router, "_score_for_account", autospec=True, side_effect=Router._score_for_account
+    ) as score:
+        assert router._pick_account() == "light"
+
+    assert score.call_count == 2
+
+
+def test_pick_skips_unavailable_accounts():
+    router = _router(["cooling", "blocked", "ok"], max_inflight_per_account=1)
+    router._acct_state["cooling"]["cooldown_until"] = router._now() + 60
+    router._inflight["blocked"] = 1
+
+    assert router._pick_account() == "ok"
+    router._inflight["ok"] = 1
+    assert router._pick_account() is None
+    assert router._any_account_can_send() is False
+
+
+def test_idle_account_is_used_without_scoring():
+    """Join-Idle-Queue: con una cuenta ociosa no se calcula ningún score."""
+    router = _router(["a", "b", "c"])
+    router._inflight["a"] = 1
+
+    with patch.object(Router, "_score_for_account", autospec=True) as score:
+        assert router._pick_account() == "b"
+
+    score.assert_not_called()
+
+
+def test_account_rejoins_idle_queue_when_drained():
+    router = _router(["a", "b"])
+    router._inflight.update({"a": 1, "b": 1})
+    router._pop_idle()
+    assert not router._idle
+
+    router._task_meta["t1"] = _TaskMeta(account="a", username="u", job_id="j", start_time=router._now())
+    router.on_result(ResultEnvelope(ok=True, task_id="t1", correlation_id="j", attempts=1))
+
+    assert list(router._idle) == ["a"]
+    assert router._pick_account() == "a"
+
+
+def test_failed_send_returns_account_to_idle_queue():
+    """Si el envío falla la cuenta sigue ociosa y vuelve a la cola JIQ."""
+    def _boom(_env):
+        raise RuntimeError("queue down")
+
+    router = Router(accounts=["a"], send_fn_by_account={"a": _boom}, config=RouterConfig())
+    router.add_job(Job(job_id="j1", kind="analyze_profile", items=["u1"]))
+
+    router.dispatch_tick()
+
+    assert router._inflight.get("a", 0) == 0
+    assert list(router._idle) == ["a"]
+
+
+def test_rejected_claim_returns_account_to_idle_queue():
+    """Un claim rechazado (tarea tomada por otro dispatcher) no saca la cuenta del JIQ."""
+    store = Mock()
+    store.claim_task.return_value = False
+    router = Router(
+        accounts=["a"],
+        send_fn_by_account={"a": lambda _env: None},
+        config=RouterConfig(),
+        job_store=store,
+    )
+    router.add_job(Job(job_id="j1", kind="analyze_profile", items=["u1"]))
+
+    router.dispatch_tick()
+
+    assert list(router._idle) == ["a"]
@@ -1,10 +1,12 @@
 """
 Tests para SendMessageUseCase.
 """
+from typing import Callable
+
 import pytest
 from unittest.mock import Mock
-from scrapinsta.application.use_cases.send_message import SendMessageUseCase
-from scrapinsta.application.dto.messages import MessageRequest, MessageContext
+from scrapinsta.application.use_cases.send_message import ProfileSnapshotCache, SendMessageUseCase
+from scrapinsta.application.dto.messages import MessageRequest
 from scrapinsta.domain.models.profile_models import ProfileSnapshot, PrivacyStatus
 from scrapinsta.domain.ports.browser_port import BrowserNavigationError
 from scrapinsta.domain.ports.message_port import (
@@ -14,6 +16,45 @@ from scrapinsta.domain.ports.message_port import (
 )
 
 
+# Request base (validado una sola vez); las variantes se derivan con model_copy
+_BASE_REQUEST = MessageRequest(target_username="targetuser", message_text=None)
+_DEFAULT_BIO = "Bio"
+
+
+@pytest.fixture(scope="module")
+def target_snapshot() -> ProfileSnapshot:
+    """Snapshot del perfil destino (inmutable, compartido por el módulo)."""
+    return ProfileSnapshot(
+        username="targetuser",
+        bio=_DEFAULT_BIO,
+        followers=1000,
+        followings=500,
+        posts=100,
+        is_verified=False,
+        privacy=PrivacyStatus.public,
+    )
+
+
+@pytest.fixture
+def make_use_case(
+    mock_browser_port: Mock,
+    mock_message_sender: Mock,
+    mock_message_composer: Mock,
+    mock_profile_repo: Mock,
+) -> Callable[..., SendMessageUseCase]:
+    """Construye el use case con los mocks del test; acepta overrides por kwarg."""
+    def _make(**overrides) -> SendMessageUseCase:
+        kwargs = dict(
+            browser=mock_browser_port,
+            sender=mock_message_sender,
+            composer=mock_message_composer,
+            profile_repo=mock_profile_repo,
+        )
+        kwargs.update(overrides)
+        return SendMessageUseCase(**kwargs)
+    return _make
+
+
 class TestSendMessageUseCase:
     """Tests para SendMessageUseCase."""
     
@@ -22,33 +63,17 @@ class TestSendMessageUseCase:
         mock_browser_port: Mock,
         mock_message_sender: Mock,
         mock_message_composer: Mock,
-        mock_profile_repo: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
     ):
         """Envío exitoso de mensaje."""
-        snapshot = ProfileSnapshot(
-            username="targetuser",
-            bio="Bio del target",
-            followers=1000,
-            followings=500,
-            posts=100,
-            is_verified=False,
-            privacy=PrivacyStatus.public,
-        )
-        mock_browser_port.get_profile_snapshot.return_value = snapshot
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
         mock_message_composer.compose_message.return_value = "Mensaje personalizado"
         mock_message_sender.send_direct_message.return_value = True
         
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-            profile_repo=mock_profile_repo,
-        )
+        use_case = make_use_case()
         
-        request = MessageRequest(
-            target_username="targetuser",
-            message_text="Hello",
-        )
+        request = _BASE_REQUEST.model_copy(update={"message_text": "Hello"})
         
         result = use_case(request)
         
@@ -71,29 +96,17 @@ class TestSendMessageUseCase:
         mock_browser_port: Mock,
         mock_message_sender: Mock,
         mock_message_composer: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
     ):
         """Envío sin repositorio (opcional)."""
-        snapshot = ProfileSnapshot(
-            username="targetuser",
-            bio="Bio",
-            followers=1000,
-            followings=500,
-            posts=100,
-            is_verified=False,
-            privacy=PrivacyStatus.public,
-        )
-        mock_browser_port.get_profile_snapshot.return_value = snapshot
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
         mock_message_composer.compose_message.return_value = "Mensaje"
         mock_message_sender.send_direct_message.return_value = True
         
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-            profile_repo=None,  # Sin repo
-        )
+        use_case = make_use_case(profile_repo=None)  # Sin repo
         
-        request = MessageRequest(target_username="targetuser", message_text=None)
+        request = _BASE_REQUEST
         result = use_case(request)
         
         assert result.success is True
@@ -103,18 +116,15 @@ class TestSendMessageUseCase:
         mock_browser_port: Mock,
         mock_message_sender: Mock,
         mock_message_composer: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
     ):
         """Error al obtener snapshot del perfil."""
         error = BrowserNavigationError("Profile not found", username="targetuser")
         mock_browser_port.get_profile_snapshot.side_effect = error
         
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-        )
+        use_case = make_use_case()
         
-        request = MessageRequest(target_username="targetuser", message_text=None)
+        request = _BASE_REQUEST
         
         result = use_case(request)
         assert result.success is False
@@ -125,28 +135,17 @@ class TestSendMessageUseCase:
         mock_browser_port: Mock,
         mock_message_sender: Mock,
         mock_message_composer: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
     ):
         """Error al componer mensaje."""
-        snapshot = ProfileSnapshot(
-            username="targetuser",
-            bio="Bio",
-            followers=1000,
-            followings=500,
-            posts=100,
-            is_verified=False,
-            privacy=PrivacyStatus.public,
-        )
-        mock_browser_port.get_profile_snapshot.return_value = snapshot
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
         mock_message_composer.compose_message.side_effect = Exception("Composer error")
         
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-        )
+        use_case = make_use_case()
         
         # message_text=None para que se llame a compose_message
-        request = MessageRequest(target_username="targetuser", message_text=None)
+        request = _BASE_REQUEST
         
         result = use_case(request)
         assert result.success is False
@@ -158,18 +157,11 @@ class TestSendMessageUseCase:
         mock_browser_port: Mock,
         mock_message_sender: Mock,
         mock_message_composer: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
     ):
         """Error transitorio al enviar mensaje (retryable) que falla después de todos los reintentos."""
-        snapshot = ProfileSnapshot(
-            username="targetuser",
-            bio="Bio",
-            followers=1000,
-            followings=500,
-            posts=100,
-            is_verified=False,
-            privacy=PrivacyStatus.public,
-        )
-        mock_browser_port.get_profile_snapshot.return_value = snapshot
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
         mock_message_composer.compose_message.return_value = "Mensaje"
         
         # Error transitorio que se reintenta pero siempre falla
@@ -177,13 +169,9 @@ class TestSendMessageUseCase:
         # DMTransientUIBlock ya tiene retryable=True por defecto
         mock_message_sender.send_direct_message.side_effect = error  # Siempre lanza el error
         
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-        )
+        use_case = make_use_case()
         
-        request = MessageRequest(target_username="targetuser", message_text=None, max_retries=2)
+        request = _BASE_REQUEST.model_copy(update={"max_retries": 2})
         
         result = use_case(request)
         
@@ -194,68 +182,27 @@ class TestSendMessageUseCase:
         assert result.target_username == "targetuser"
         assert mock_message_sender.send_direct_message.call_count >= 2
     
-    def test_send_message_timeout_error(
-        self,
-        mock_browser_port: Mock,
-        mock_message_sender: Mock,
-        mock_message_composer: Mock,
-    ):
-        """Error de timeout al enviar mensaje."""
-        snapshot = ProfileSnapshot(
-            username="targetuser",
-            bio="Bio",
-            followers=1000,
-            followings=500,
-            posts=100,
-            is_verified=False,
-            privacy=PrivacyStatus.public,
-        )
-        mock_browser_port.get_profile_snapshot.return_value = snapshot
-        mock_message_composer.compose_message.return_value = "Mensaje"
-        
-        error = DMInputTimeout("Input timeout")
-        mock_message_sender.send_direct_message.side_effect = error
-        
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-        )
-        
-        request = MessageRequest(target_username="targetuser", message_text=None)
-        
-        result = use_case(request)
-        assert result.success is False
-    
-    def test_send_message_unexpected_error(
+    @pytest.mark.parametrize("error", [
+        DMInputTimeout("Input timeout"),
+        DMUnexpectedError("Unexpected error"),
+    ], ids=["timeout", "unexpected"])
+    def test_send_message_sender_error(
         self,
         mock_browser_port: Mock,
         mock_message_sender: Mock,
         mock_message_composer: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
+        error: Exception,
     ):
-        """Error inesperado al enviar mensaje."""
-        snapshot = ProfileSnapshot(
-            username="targetuser",
-            bio="Bio",
-            followers=1000,
-            followings=500,
-            posts=100,
-            is_verified=False,
-            privacy=PrivacyStatus.public,
-        )
-        mock_browser_port.get_profile_snapshot.return_value = snapshot
+        """Error del sender (timeout o inesperado) al enviar mensaje."""
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
         mock_message_composer.compose_message.return_value = "Mensaje"
-        
-        error = DMUnexpectedError("Unexpected error")
         mock_message_sender.send_direct_message.side_effect = error
         
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-        )
+        use_case = make_use_case()
         
-        request = MessageRequest(target_username="targetuser", message_text=None)
+        request = _BASE_REQUEST
         
         result = use_case(request)
         assert result.success is False
@@ -265,29 +212,18 @@ class TestSendMessageUseCase:
         mock_browser_port: Mock,
         mock_message_sender: Mock,
         mock_message_composer: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
     ):
         """Normaliza el username antes de procesar."""
-        snapshot = ProfileSnapshot(
-            username="targetuser",
-            bio="Bio",
-            followers=1000,
-            followings=500,
-            posts=100,
-            is_verified=False,
-            privacy=PrivacyStatus.public,
-        )
-        mock_browser_port.get_profile_snapshot.return_value = snapshot
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
         mock_message_composer.compose_message.return_value = "Mensaje"
         mock_message_sender.send_direct_message.return_value = True
         
-        use_case = SendMessageUseCase(
-            browser=mock_browser_port,
-            sender=mock_message_sender,
-            composer=mock_message_composer,
-        )
+        use_case = make_use_case()
         
         # Username con espacios y @ (Pydantic lo normaliza)
-        request = MessageRequest(target_username="targetuser", message_text=None)
+        request = _BASE_REQUEST
         result = use_case(request)
         
         assert result.success is True
@@ -295,3 +231,77 @@ class TestSendMessageUseCase:
         call_args = mock_browser_port.get_profile_snapshot.call_args
         assert call_args[0][0] == "targetuser"  # Normalizado a lowercase
 
+
+class TestSendMessageSnapshotCache:
+    """Tests para el cache de snapshots del use case."""
+
+    def test_cached_snapshot_skips_browser_and_upsert(
+        self,
+        mock_browser_port: Mock,
+        mock_message_sender: Mock,
+        mock_profile_repo: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
+    ):
+        """Un reintento sobre el mismo destino reutiliza el snapshot cacheado."""
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
+        mock_message_sender.send_direct_message.return_value = False
+        cache = ProfileSnapshotCache()
+
+        use_case = make_use_case(snapshot_cache=cache)
+        request = _BASE_REQUEST.model_copy(update={"message_text": "Hello"})
+
+        use_case(request)
+        use_case(request)
+
+        mock_browser_port.get_profile_snapshot.assert_called_once_with("targetuser")
+        mock_profile_repo.upsert_profile.assert_called_once()
+
+    def test_successful_send_invalidates_snapshot(
+        self,
+        mock_browser_port: Mock,
+        mock_message_sender: Mock,
+        make_use_case: Callable[..., SendMessageUseCase],
+        target_snapshot: ProfileSnapshot,
+    ):
+        mock_browser_port.get_profile_snapshot.return_value = target_snapshot
+        mock_message_sender.send_direct_message.return_value = True
+        cache = ProfileSnapshotCache()
+
+        use_case = make_use_case(snapshot_cache=cache)
+        request = _BASE_REQUEST.model_copy(update={"message_text": "Hello"})
+
+        assert use_case(request).success is True
+        assert cache.get("targetuser") is None
+        use_case(request)
+
+        assert mock_browser_port.get_profile_snapshot.call_count == 2
+
+    def test_expired_snapshot_is_dropped(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        target_snapshot: ProfileSnapshot,
+    ):
+        """Pasado el TTL el snapshot deja de servirse."""
+        from scrapinsta.application.use_cases import send_message as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        cache = ProfileSnapshotCache(ttl_s=10)
+        cache.put("targetuser", target_snapshot)
+
+        now[0] += 9
+        assert cache.get("targetuser") is target_snapshot
+        now[0] += 2
+        assert cache.get("targetuser") is None
+
+    def test_lru_bound(self, target_snapshot: ProfileSnapshot):
+        cache = ProfileSnapshotCache(maxsize=2)
+        cache.put("a", target_snapshot)
+        cache.put("b", target_snapshot)
+        cache.get("a")
+        cache.put("c", target_snapshot)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is target_snapshot
+        assert cache.get("c") is target_snapshot
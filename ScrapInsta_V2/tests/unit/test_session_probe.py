@@ -0,0 +1,35 @@
+"""
+Tests para session_probe.has_active_session_in_driver.
+"""
+import pytest
+from unittest.mock import Mock
+
+from scrapinsta.infrastructure.auth import session_probe
+from scrapinsta.infrastructure.auth.session_probe import has_active_session_in_driver
+
+
+def test_waits_for_document_before_reading_cookies(monkeypatch: pytest.MonkeyPatch):
+    """Las cookies se leen recién después de esperar el documento del host navegado."""
+    calls = []
+    monkeypatch.setattr(
+        session_probe,
+        "wait_dom_interactive",
+        lambda driver, **kw: calls.append(("wait", kw)) or True,
+    )
+    driver = Mock()
+    driver.get_cookies.side_effect = lambda: calls.append(("cookies", None)) or [{"name": "sessionid"}]
+
+    assert has_active_session_in_driver(driver, timeout_s=3.0) is True
+
+    assert calls == [
+        ("wait", {"url_contains": "www.instagram.com", "timeout": 3.0}),
+        ("cookies", None),
+    ]
+
+
+def test_no_session_cookie(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(session_probe, "wait_dom_interactive", lambda *_a, **_k: True)
+    driver = Mock()
+    driver.get_cookies.return_value = [{"name": "csrftoken"}]
+
+    assert has_active_session_in_driver(driver) is False
@@ -2,47 +2,49 @@
 Tests para TaskDispatcher.
 """
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
 from scrapinsta.application.services.task_dispatcher import TaskDispatcher
-from scrapinsta.application.dto.tasks import TaskEnvelope, ResultEnvelope
+from scrapinsta.application.dto.tasks import TaskEnvelope
+
+
+class _FakeResponse:
+    """Respuesta mínima de un use case: solo expone model_dump()."""
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def model_dump(self) -> dict:
+        return self._data
 
 
 class TestTaskDispatcher:
     """Tests para TaskDispatcher."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_factory(self):
-        """Mock de UseCaseFactory."""
+        """Mock de UseCaseFactory (compartido por la clase, se resetea por test)."""
         factory = Mock()
         factory.create_analyze_profile = Mock(return_value=Mock())
         factory.create_send_message = Mock(return_value=Mock())
         factory.create_fetch_followings = Mock(return_value=Mock())
         return factory
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def dispatcher(self, mock_factory):
-        """Instancia de TaskDispatcher."""
+        """Instancia de TaskDispatcher (sin estado entre dispatches)."""
         return TaskDispatcher(mock_factory)
     
-    def test_dispatch_unknown_task(self, dispatcher):
-        """Retorna error para task desconocido."""
-        # TaskEnvelope valida que task sea uno de los valores Literal
-        # Necesitamos crear el envelope de forma que pase la validación de Pydantic
-        # pero luego el dispatcher lo rechace. Sin embargo, Pydantic no permitirá crear
-        # un TaskEnvelope con task inválido. Vamos a testear que el dispatcher maneja
-        # correctamente un task que no está en _ROUTES (aunque esto no debería pasar
-        # porque Pydantic lo previene). Mejor testeamos con un task válido pero que
-        # no esté en _ROUTES... pero todos los tasks válidos están en _ROUTES.
-        # Este test no es realista, mejor lo eliminamos o lo cambiamos.
-        # Por ahora, lo comentamos o lo adaptamos.
-        pass  # Este test no es aplicable porque Pydantic previene tasks inválidos
+    @pytest.fixture(autouse=True)
+    def _reset_factory(self, mock_factory):
+        """Limpia llamadas, return_value y side_effect configurados en el factory compartido."""
+        mock_factory.reset_mock(return_value=True, side_effect=True)
     
     def test_dispatch_analyze_profile_success(self, dispatcher, mock_factory):
         """Dispatch exitoso para analyze_profile."""
         # Mock del use case
         mock_use_case = Mock()
-        mock_response = Mock()
-        mock_response.model_dump.return_value = {"username": "test", "followers": 1000}
+        mock_response = _FakeResponse({"username": "test", "followers": 1000})
         mock_use_case.return_value = mock_response
         mock_factory.create_analyze_profile.return_value = mock_use_case
         
@@ -62,8 +64,7 @@ class TestTaskDispatcher:
     def test_dispatch_send_message_success(self, dispatcher, mock_factory):
         """Dispatch exitoso para send_message."""
         mock_use_case = Mock()
-        mock_response = Mock()
-        mock_response.model_dump.return_value = {"success": True}
+        mock_response = _FakeResponse({"success": True})
         mock_use_case.return_value = mock_response
         mock_factory.create_send_message.return_value = mock_use_case
         
@@ -82,8 +83,7 @@ class TestTaskDispatcher:
     def test_dispatch_fetch_followings_success(self, dispatcher, mock_factory):
         """Dispatch exitoso para fetch_followings."""
         mock_use_case = Mock()
-        mock_response = Mock()
-        mock_response.model_dump.return_value = {"owner": "test", "followings": ["user1"]}
+        mock_response = _FakeResponse({"owner": "test", "followings": ["user1"]})
         mock_use_case.return_value = mock_response
         mock_factory.create_fetch_followings.return_value = mock_use_case
         
@@ -164,8 +164,7 @@ class TestTaskDispatcher:
     def test_dispatch_preserves_correlation_id(self, dispatcher, mock_factory):
         """Preserva correlation_id en el resultado."""
         mock_use_case = Mock()
-        mock_response = Mock()
-        mock_response.model_dump.return_value = {}
+        mock_response = _FakeResponse({})
         mock_use_case.return_value = mock_response
         mock_factory.create_analyze_profile.return_value = mock_use_case
         